@@ -10,25 +10,62 @@ Antsibull Nox Helper.
 
 from __future__ import annotations
 
+import importlib
+import typing as t
 from pathlib import Path
 
-from .cd import init_cd
-from .config import (
-    CONFIG_FILENAME,
-    load_config_from_toml,
-)
-from .interpret_config import interpret_config
-from .reporting import setup as _setup_reporting
-from .sessions.ansible_test import add_ansible_test_session
-from .sessions.utils import IN_CI
+if t.TYPE_CHECKING:
+    from .sessions.ansible_test import add_ansible_test_session
+    from .sessions.utils import IN_CI
 
 __version__ = "1.8.1.post0"
 
+# Attributes that are only imported on first access. This avoids loading all
+# session code when only parts of antsibull-nox are needed, like for the CLI.
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "add_ansible_test_session": ".sessions.ansible_test",
+    "IN_CI": ".sessions.utils",
+}
+
+# Submodules that used to be available after importing antsibull_nox,
+# since the session code imported them. They are now imported on demand.
+_LAZY_SUBMODULES = frozenset(
+    (
+        "_pydantic",
+        "ansible",
+        "ansible_test_config",
+        "cd",
+        "collection",
+        "config",
+        "container",
+        "data",
+        "data_util",
+        "ee_config",
+        "interpret_config",
+        "lint_config",
+        "messages",
+        "paths",
+        "python",
+        "reporting",
+        "sessions",
+        "utils",
+        "vcs",
+    )
+)
+
 
 def load_antsibull_nox_toml() -> None:
     """
     Load and interpret antsibull-nox.toml config file.
     """
+    # pylint: disable=import-outside-toplevel
+    from .cd import init_cd
+    from .config import CONFIG_FILENAME, load_config_from_toml
+    from .interpret_config import interpret_config
+    from .reporting import setup as _setup_reporting
+
+    # pylint: enable=import-outside-toplevel
+
     _setup_reporting()
     config_path = Path(CONFIG_FILENAME)
     config = load_config_from_toml(config_path)
@@ -36,6 +73,17 @@ def load_antsibull_nox_toml() -> None:
     interpret_config(config)
 
 
+def __getattr__(name: str) -> t.Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+        globals()[name] = value
+        return value
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = (
     "__version__",
     "add_ansible_test_session",
@@ -46,23 +46,41 @@ _MIN_SUPPORTED_VERSION = Version.parse("2.9")
 _CURRENT_DEVEL_VERSION = Version.parse("2.22")
 _CURRENT_MILESTONE_VERSION = Version.parse("2.22")
 
-_SUPPORTED_CORE_VERSIONS: dict[Version | t.Literal["milestone"], AnsibleCoreInfo] = {
-    (
-        "milestone"
-        if ansible_version == "milestone"
-        else Version.parse(ansible_version)
-    ): AnsibleCoreInfo(
-        ansible_core_version=(
-            _CURRENT_MILESTONE_VERSION
-            if ansible_version == "milestone"
-            else Version.parse(ansible_version)
-        ),
-        controller_python_versions=tuple(
-            Version.parse(v) for v in controller_python_versions
-        ),
-        remote_python_versions=tuple(Version.parse(v) for v in remote_python_versions),
-    )
-    for ansible_version, (controller_python_versions, remote_python_versions) in {
+
+def _create_supported_core_versions(
+    data: dict[str, list[list[str]]],
+) -> dict[AnsibleCoreVersion, AnsibleCoreInfo]:
+    result: dict[AnsibleCoreVersion, AnsibleCoreInfo] = {}
+    for ansible_version, (
+        controller_python_versions,
+        remote_python_versions,
+    ) in data.items():
+        # Parse every ansible-core version only once, and use the same object
+        # both as key and in the info object.
+        key: AnsibleCoreVersion
+        if ansible_version == "milestone":
+            key = "milestone"
+            version = _CURRENT_MILESTONE_VERSION
+        else:
+            key = version = Version.parse(ansible_version)
+        # Creating tuples from lists is faster than from generators
+        # pylint: disable=consider-using-generator
+        result[key] = AnsibleCoreInfo(
+            ansible_core_version=version,
+            controller_python_versions=tuple(
+                [Version.parse(v) for v in controller_python_versions]
+            ),
+            remote_python_versions=tuple(
+                [Version.parse(v) for v in remote_python_versions]
+            ),
+        )
+    # Also add devel, so that get_ansible_core_info() is a single lookup
+    result["devel"] = result[_CURRENT_DEVEL_VERSION]
+    return result
+
+
+_SUPPORTED_CORE_VERSIONS = _create_supported_core_versions(
+    {
         "2.9": [
             ["2.7", "3.5", "3.6", "3.7", "3.8"],
             ["2.6", "2.7", "3.5", "3.6", "3.7", "3.8"],
@@ -161,8 +179,8 @@ _SUPPORTED_CORE_VERSIONS: dict[Version | t.Literal["milestone"], AnsibleCoreInfo
             ["3.16", "3.17", "3.18"],
             ["3.13", "3.14", "3.15", "3.16", "3.17", "3.18"],
         ],
-    }.items()
-}
+    }
+)
 
 
 def get_actual_ansible_core_version(
@@ -184,16 +202,10 @@ def get_ansible_core_info(
     """
     Retrieve information on an ansible-core version.
     """
-    version: Version
-    if core_version == "devel":
-        version = _CURRENT_DEVEL_VERSION
-    elif core_version == "milestone":
-        return _SUPPORTED_CORE_VERSIONS["milestone"]
-    else:
-        version = core_version
-    if version in _SUPPORTED_CORE_VERSIONS:
-        return _SUPPORTED_CORE_VERSIONS[version]
-    raise ValueError(f"Unknown ansible-core version {version}")
+    try:
+        return _SUPPORTED_CORE_VERSIONS[core_version]
+    except KeyError:
+        raise ValueError(f"Unknown ansible-core version {core_version}") from None
 
 
 _ANSIBLE_REPO = "ansible/ansible"
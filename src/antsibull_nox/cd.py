@@ -16,7 +16,6 @@ from pathlib import Path
 
 from .config import VCS as VCSConfig
 from .config import Config
-from .paths.utils import relative_to_walk_up
 from .vcs import VCS, VcsProvider
 from .vcs.factory import get_vcs_provider
 
@@ -40,10 +39,9 @@ class _CDConfig:
             raise ValueError(f"Cannot find {self.vcs} repository for {path}")
         self.repo = repo
         self.config_dir_is_repo_dir = repo.absolute() == config_path.parent.absolute()
-        self.base_branch = vcs_config.development_branch
-        env_base_branch = os.environ.get(_BASE_BRANCH_ENV_VAR)
-        if env_base_branch:
-            self.base_branch = env_base_branch
+        self.base_branch = (
+            os.environ.get(_BASE_BRANCH_ENV_VAR) or vcs_config.development_branch
+        )
 
 
 _cd_initialized = False  # pylint: disable=invalid-name
@@ -67,23 +65,25 @@ def init_cd(
     if _cd_initialized and not ignore_previous_calls:
         raise ValueError("init_cd() has already been called!")
 
+    _get_repo_changes.cache_clear()
+
     if config.vcs is None:
         _cd_config = None
         _cd_initialized = True
         return
 
-    if not force:
-        value = (os.environ.get(_ENABLE_CD_ENV_VAR) or "").lower()
-        if value != "true":
-            _cd_config = None
-            _cd_initialized = True
-            return
+    if not force and (os.environ.get(_ENABLE_CD_ENV_VAR) or "").lower() != "true":
+        _cd_config = None
+        _cd_initialized = True
+        return
 
     _cd_config = _CDConfig(config_path=config_path, vcs_config=config.vcs)
     _cd_initialized = True
 
 
 def _check_initialized() -> None:
+    # Callers only need to call this if _cd_config is None,
+    # since _cd_config is only set by init_cd().
     if not _cd_initialized:
         raise RuntimeError("Internal error: init_cd() has not been called!")
 
@@ -92,8 +92,10 @@ def supports_cd() -> bool:
     """
     Determines whether a antsibull-nox configuration supports CD.
     """
+    if _cd_config is not None:
+        return True
     _check_initialized()
-    return _cd_config is not None
+    return False
 
 
 def get_vcs_name() -> VCS | None:
@@ -102,8 +104,10 @@ def get_vcs_name() -> VCS | None:
 
     Returns ``None`` if ``supports_cd() == False``.
     """
-    _check_initialized()
-    return _cd_config.vcs if _cd_config else None
+    if _cd_config is None:
+        _check_initialized()
+        return None
+    return _cd_config.vcs
 
 
 def get_base_branch() -> str | None:
@@ -112,8 +116,10 @@ def get_base_branch() -> str | None:
 
     Returns ``None`` if ``supports_cd() == False``.
     """
-    _check_initialized()
-    return _cd_config.base_branch if _cd_config else None
+    if _cd_config is None:
+        _check_initialized()
+        return None
+    return _cd_config.base_branch
 
 
 def is_config_dir_the_repo_dir() -> bool | None:
@@ -123,11 +129,28 @@ def is_config_dir_the_repo_dir() -> bool | None:
 
     Returns ``None`` if ``supports_cd() == False``.
     """
-    _check_initialized()
-    return _cd_config.config_dir_is_repo_dir if _cd_config else None
+    if _cd_config is None:
+        _check_initialized()
+        return None
+    return _cd_config.config_dir_is_repo_dir
 
 
 @functools.cache
+def _get_repo_changes() -> list[Path] | None:
+    """
+    Acquire a list of changes relative to the repository's root.
+
+    Returns ``None`` if change detection is not available.
+    """
+    cd_config = _cd_config
+    if cd_config is None:
+        _check_initialized()
+        return None
+    return cd_config.provider.get_changes_compared_to(
+        repo=cd_config.repo, branch=cd_config.base_branch
+    )
+
+
 def get_changes(*, relative_to: Path | None = None) -> list[Path] | None:
     """
     Acquire a list of changes.
@@ -136,18 +159,27 @@ def get_changes(*, relative_to: Path | None = None) -> list[Path] | None:
 
     Returned paths are relative to ``relative_to``, or CWD if ``relative_to is None``.
     """
-    _check_initialized()
-    cd_config = _cd_config
-    if not cd_config:
+    # Only query the VCS once, no matter which paths are used for relative_to
+    changes = _get_repo_changes()
+    if changes is None or _cd_config is None:
         return None
-    changes = cd_config.provider.get_changes_compared_to(
-        repo=cd_config.repo, branch=cd_config.base_branch
-    )
 
     if relative_to is None:
         relative_to = Path.cwd()
 
-    return [relative_to_walk_up(cd_config.repo / path, relative_to) for path in changes]
+    # Most changed files are usually below relative_to, so we can simply cut
+    # off the prefix. Only use os.path.relpath() for the others.
+    repo_prefix = os.path.join(_cd_config.repo, "")
+    base_prefix = os.path.join(relative_to, "")
+    base_len = len(base_prefix)
+    result: list[Path] = []
+    for path in changes:
+        full_path = f"{repo_prefix}{path}"
+        if full_path.startswith(base_prefix):
+            result.append(Path(full_path[base_len:]))
+        else:
+            result.append(Path(os.path.relpath(full_path, relative_to)))
+    return result
 
 
 __all__ = (
@@ -15,33 +15,27 @@ import json
 import os
 import os.path
 import sys
+import typing as t
 from collections.abc import Callable
 from pathlib import Path
 
-import pydantic as _p
-
 from . import __version__
-from ._pydantic import get_formatted_error_messages as _get_formatted_error_messages
-from .azp import ExtraSession as _AzpExtraSession
-from .azp import update_azp_config as _update_azp_config
-from .cd import get_base_branch, get_changes, init_cd, supports_cd
-from .config import CONFIG_FILENAME, load_config_from_toml
-from .init import create_initial_config as _create_initial_config
-from .lint_config import lint_config as _lint_config
-from .sessions.utils.paths import PythonDependencies, add_python_deps
 
-try:
-    import argcomplete
+if t.TYPE_CHECKING:
+    from .sessions.utils.paths import PythonDependencies
 
-    HAS_ARGCOMPLETE = True
-except ImportError:
-    HAS_ARGCOMPLETE = False
+# The implementations of the subcommands are only imported by the functions
+# handling them. Importing them (and their dependencies, like pydantic and nox)
+# takes considerably more time than parsing the arguments.
+# pylint: disable=import-outside-toplevel
 
 
 def lint_config(_: argparse.Namespace) -> int:
     """
     Lint antsibull-nox config file.
     """
+    from .lint_config import lint_config as _lint_config
+
     errors = _lint_config()
     for error in errors:
         print(error)
@@ -52,6 +46,8 @@ def create_initial_config(_: argparse.Namespace) -> int:
     """
     Create noxfile.py and antsibull-nox.toml.
     """
+    from .init import create_initial_config as _create_initial_config
+
     try:
         _create_initial_config()
     except Exception as exc:  # pylint: disable=broad-exception-caught
@@ -64,6 +60,10 @@ def show_changes(args: argparse.Namespace) -> int:
     """
     Show changes.
     """
+    from .cd import get_base_branch, get_changes, init_cd, supports_cd
+    from .config import CONFIG_FILENAME, load_config_from_toml
+    from .sessions.utils.paths import add_python_deps
+
     add_python_deps_opt: PythonDependencies = args.add_python_deps
 
     config_path = Path(CONFIG_FILENAME)
@@ -117,6 +117,14 @@ def update_azp_config(args: argparse.Namespace) -> int:
     """
     Update AZP config.
     """
+    import pydantic as _p
+
+    from ._pydantic import (
+        get_formatted_error_messages as _get_formatted_error_messages,
+    )
+    from .azp import ExtraSession as _AzpExtraSession
+    from .azp import update_azp_config as _update_azp_config
+
     min_ansible_core: str | None = args.min_ansible_core
     max_ansible_core: str | None = args.max_ansible_core
     include_tags: str | None = args.include_tags
@@ -253,9 +261,15 @@ def parse_args(program_name: str, args: list[str]) -> argparse.Namespace:
         help="Show differences if configuration file is modified",
     )
 
-    # This must come after all parser setup
-    if HAS_ARGCOMPLETE:
-        argcomplete.autocomplete(toplevel_parser)
+    # This must come after all parser setup.
+    # argcomplete sets _ARGCOMPLETE when it asks for completions; only import it then.
+    if "_ARGCOMPLETE" in os.environ:
+        try:
+            import argcomplete  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            pass
+        else:
+            argcomplete.autocomplete(toplevel_parser)
 
     parsed_args: argparse.Namespace = toplevel_parser.parse_args(args)
     return parsed_args
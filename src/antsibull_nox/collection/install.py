@@ -10,11 +10,15 @@ Handle Ansible collections.
 
 from __future__ import annotations
 
+import json
 import os
 import shutil
+import stat
 import tempfile
 import typing as t
+from collections import deque
 from collections.abc import Iterable
+from contextlib import ExitStack
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -22,7 +26,6 @@ from antsibull_fileutils.yaml import load_yaml_file
 
 from ..ansible import AnsibleCoreVersion
 from ..paths.utils import copy_collection as _paths_copy_collection
-from ..paths.utils import relative_to_walk_up as _relative_to_walk_up
 from ..paths.utils import remove_path as _remove
 from .data import CollectionData, CollectionSource, SetupResult
 from .extract import extract_tarball
@@ -31,6 +34,7 @@ from .search import (
     Runner,
     _update_collection_list,
     get_collection_list,
+    get_filesystem_collection_list,
 )
 
 
@@ -206,6 +210,12 @@ _COLLECTION_SOURCES_PER_CORE_VERSION: dict[AnsibleCoreVersion, _CollectionSource
 _COLLECTION_DOWNLOAD_CACHE = _CollectionDownloadCache()
 _TARBALL_EXTENSION = ".tar.gz"
 _INSTALLATION_CONFIG_ENV_VAR = "ANTSIBULL_NOX_INSTALL_COLLECTIONS"
+_INSTALL_FINGERPRINT_SUFFIX = ".antsibull-nox-install.json"
+_SUPPORTS_DIR_FD = hasattr(os, "O_DIRECTORY") and {
+    os.readlink,
+    os.symlink,
+    os.unlink,
+}.issubset(os.supports_dir_fd)
 
 
 def setup_collection_sources(
@@ -442,9 +452,9 @@ def _add_all_dependencies(
     missing_dependencies: _MissingDependencies,
     all_collections: CollectionList,
 ) -> None:
-    to_process = list(collections.values())
+    to_process = deque(collections.values())
     while to_process:
-        collection = to_process.pop(0)
+        collection = to_process.popleft()
         for dependency_name in collection.dependencies:
             if dependency_name not in collections:
                 dependency_data = all_collections.find(dependency_name)
@@ -458,46 +468,122 @@ def _add_all_dependencies(
                 to_process.append(dependency_data)
 
 
-def _install_collection(collection: CollectionData, path: Path) -> None:
+def _install_collection(
+    collection: CollectionData, path: Path, *, dir_fd: int | None = None
+) -> None:
+    """
+    Ensure that ``path`` is a symlink to the collection's absolute path.
+
+    If ``dir_fd`` is provided, it must be a file descriptor for ``path``'s parent
+    directory. It is used to avoid resolving the parent directory for every call.
+    """
     # Compute absolute path
-    sym_path = collection.path.absolute()
-    # Ensure that path is symlink with this absolute path
-    if path.is_symlink():
-        if path.readlink() == sym_path:
-            return
-        path.unlink()
-    else:
+    sym_path = str(collection.path.absolute())
+    dest = str(path) if dir_fd is None else path.name
+    # Use os functions on strings since this is called for every collection.
+    try:
+        current_sym_path = os.readlink(dest, dir_fd=dir_fd)
+    except OSError:
+        # Not a symlink, or does not exist
         _remove(path)
-    path.symlink_to(sym_path)
+    else:
+        if current_sym_path == sym_path:
+            return
+        os.unlink(dest, dir_fd=dir_fd)
+    os.symlink(sym_path, dest, dir_fd=dir_fd)
+
+
+def _get_install_fingerprint_path(path: Path) -> Path:
+    # The fingerprint is stored next to the installed collection, and not inside,
+    # since every file inside is visible as part of the collection
+    return path.parent / f".{path.name}{_INSTALL_FINGERPRINT_SUFFIX}"
+
+
+def _load_install_fingerprint(path: Path) -> dict[str, t.Any] | None:
+    try:
+        with open(_get_install_fingerprint_path(path), "rb") as f:
+            return json.load(f)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return None
+
+
+def _store_install_fingerprint(path: Path, fingerprint: dict[str, t.Any]) -> None:
+    try:
+        # Any change to the entries of path changes its modification time
+        fingerprint["mtime_ns"] = path.lstat().st_mtime_ns
+        with open(_get_install_fingerprint_path(path), "w", encoding="utf-8") as f:
+            json.dump(fingerprint, f)
+    except OSError:
+        # The fingerprint is only an optimization
+        pass
+
+
+def _is_installed_directory_unchanged(
+    path: Path, fingerprint: dict[str, t.Any]
+) -> bool:
+    stored_fingerprint = _load_install_fingerprint(path)
+    if stored_fingerprint is None:
+        return False
+    try:
+        path_stat = path.lstat()
+    except OSError:
+        return False
+    return stat.S_ISDIR(path_stat.st_mode) and stored_fingerprint == {
+        **fingerprint,
+        "mtime_ns": path_stat.st_mtime_ns,
+    }
 
 
 def _install_current_collection(
     collection: CollectionData, path: Path, *, use_relative_symlinks: bool
 ) -> None:
-    if path.exists() and (path.is_symlink() or not path.is_dir()):
-        path.unlink()
+    source = str(collection.path.absolute())
+    dest = str(path)
+    with os.scandir(source) as it:
+        source_entries = sorted(
+            (entry.name, entry.path) for entry in it if entry.name != ".nox"
+        )
+    # If the source's entries did not change since the last installation,
+    # and nothing modified the installation, there is nothing to do
+    fingerprint: dict[str, t.Any] = {
+        "source": source,
+        "relative": use_relative_symlinks,
+        "entries": [name for name, _ in source_entries],
+    }
+    if _is_installed_directory_unchanged(path, fingerprint):
+        return
+
+    try:
+        if not stat.S_ISDIR(os.lstat(dest).st_mode):
+            os.unlink(dest)
+    except FileNotFoundError:
+        pass
     path.mkdir(exist_ok=True)
-    present = {p.name for p in path.iterdir()}
-    for source_entry in collection.path.absolute().iterdir():
-        if source_entry.name == ".nox":
-            continue
-        dest_entry = path / source_entry.name
+    present = set(os.listdir(dest))
+    # Use os functions on strings since this loop runs for every entry
+    # of the collection's root directory
+    for name, source_entry in source_entries:
+        dest_entry = os.path.join(dest, name)
         # Compute relative path
         sym_path = (
-            _relative_to_walk_up(source_entry, path)
+            os.path.relpath(source_entry, dest)
             if use_relative_symlinks
             else source_entry
         )
         # Ensure that dest_entry is symlink with this relative/absolute path
-        if source_entry.name in present:
-            present.remove(source_entry.name)
-            if dest_entry.is_symlink() and dest_entry.readlink() == sym_path:
-                continue
-            _remove(dest_entry)
-        dest_entry.symlink_to(sym_path)
+        if name in present:
+            present.remove(name)
+            try:
+                if os.readlink(dest_entry) == sym_path:
+                    continue
+            except OSError:
+                # Not a symlink
+                pass
+            _remove(Path(dest_entry))
+        os.symlink(sym_path, dest_entry)
     for name in present:
-        dest_entry = path / name
-        _remove(dest_entry)
+        _remove(path / name)
+    _store_install_fingerprint(path, fingerprint)
 
 
 def _install_collections(
@@ -507,47 +593,79 @@ def _install_collections(
     with_current: bool,
     use_relative_symlinks_for_current: bool = True,
 ) -> None:
-    for collection in collections:
-        namespace_dir = root / collection.namespace
-        namespace_dir.mkdir(exist_ok=True)
-        path = namespace_dir / collection.name
-        if not collection.current:
-            _install_collection(collection, path)
-        elif with_current:
-            _install_current_collection(
-                collection,
-                path,
-                use_relative_symlinks=use_relative_symlinks_for_current,
-            )
+    namespace_dirs: dict[str, tuple[Path, int | None]] = {}
+    with ExitStack() as exit_stack:
+        for collection in collections:
+            entry = namespace_dirs.get(collection.namespace)
+            if entry is None:
+                namespace_dir = root / collection.namespace
+                namespace_dir.mkdir(exist_ok=True)
+                dir_fd = None
+                if _SUPPORTS_DIR_FD:
+                    # Open the namespace directory once, so that it does not need
+                    # to be resolved again for every operation on its collections
+                    dir_fd = os.open(namespace_dir, os.O_RDONLY | os.O_DIRECTORY)
+                    exit_stack.callback(os.close, dir_fd)
+                entry = namespace_dir, dir_fd
+                namespace_dirs[collection.namespace] = entry
+            namespace_dir, dir_fd = entry
+            path = namespace_dir / collection.name
+            if not collection.current:
+                _install_collection(collection, path, dir_fd=dir_fd)
+            elif with_current:
+                _install_current_collection(
+                    collection,
+                    path,
+                    use_relative_symlinks=use_relative_symlinks_for_current,
+                )
 
 
 def _extract_collections_from_extra_deps_file(path: str | os.PathLike) -> list[str]:
-    if not os.path.exists(path):
-        return []
     try:
         data = load_yaml_file(path)
         result = []
-        if data.get("collections"):
-            for index, collection in enumerate(data["collections"]):
-                if isinstance(collection, str):
-                    result.append(collection)
-                    continue
-                if not isinstance(collection, dict):
-                    raise ValueError(
-                        f"Collection entry #{index + 1} must be a string or dictionary"
-                    )
-                if not isinstance(collection.get("name"), str):
+        for index, collection in enumerate(data.get("collections") or ()):
+            name: t.Any
+            if isinstance(collection, str):
+                name = collection
+            elif isinstance(collection, dict):
+                name = collection.get("name")
+                if not isinstance(name, str):
                     raise ValueError(
                         f"Collection entry #{index + 1} does not have a 'name' field of type string"
                     )
-                result.append(collection["name"])
+            else:
+                raise ValueError(
+                    f"Collection entry #{index + 1} must be a string or dictionary"
+                )
+            result.append(name)
         return result
+    except FileNotFoundError:
+        # Try to open the file instead of checking for its existence first
+        return []
     except Exception as exc:
         raise ValueError(
             f"Error while loading collection dependency file {path}: {exc}"
         ) from exc
 
 
+def _find_collections_to_install(
+    all_collections: CollectionList,
+    requested: list[tuple[str, _Source]],
+) -> tuple[dict[str, CollectionData], _MissingDependencies]:
+    current = all_collections.current
+    collections_to_install = {current.full_name: current}
+    missing = _MissingDependencies()
+    for collection, source in requested:
+        collection_data = all_collections.find(collection)
+        if collection_data is None:
+            missing.add(collection, source=source)
+        else:
+            collections_to_install[collection_data.full_name] = collection_data
+    _add_all_dependencies(collections_to_install, missing, all_collections)
+    return collections_to_install, missing
+
+
 def setup_collections(
     destination: str | os.PathLike,
     runner: Runner,
@@ -562,36 +680,37 @@ def setup_collections(
     """
     Setup all collections in a tree structure inside the destination directory.
     """
-    all_collections = get_collection_list(
-        runner=runner,
-        global_cache_dir=global_cache_dir,
-        ansible_core_version=ansible_core_version,
-    )
-    destination_root = Path(destination) / "ansible_collections"
-    destination_root.mkdir(exist_ok=True)
-    current = all_collections.current
-    collections_to_install = {current.full_name: current}
-    missing = _MissingDependencies()
+    requested: list[tuple[str, _Source]] = []
     if extra_collections:
         for collection in extra_collections:
-            collection_data = all_collections.find(collection)
-            if collection_data is None:
-                missing.add(collection, source=_Source.from_other("noxfile"))
-            else:
-                collections_to_install[collection_data.full_name] = collection_data
+            requested.append((collection, _Source.from_other("noxfile")))
     if extra_deps_files is not None:
         for extra_deps_file in extra_deps_files:
             path = Path(extra_deps_file)
             for collection in _extract_collections_from_extra_deps_file(path):
-                collection_data = all_collections.find(collection)
-                if collection_data is None:
-                    missing.add(collection, source=_Source.from_file(path))
-                else:
-                    collections_to_install[collection_data.full_name] = collection_data
-    while True:
-        _add_all_dependencies(collections_to_install, missing, all_collections)
-        if missing.is_empty():
-            break
+                requested.append((collection, _Source.from_file(path)))
+
+    # Collections found next to the current collection take precedence over
+    # everything else. If they already satisfy all requirements, we do not need
+    # to ask ansible-galaxy for the installed collections, which is slow.
+    all_collections = get_filesystem_collection_list(global_cache_dir=global_cache_dir)
+    collections_to_install, missing = _find_collections_to_install(
+        all_collections, requested
+    )
+    if not missing.is_empty():
+        all_collections = get_collection_list(
+            runner=runner,
+            global_cache_dir=global_cache_dir,
+            ansible_core_version=ansible_core_version,
+        )
+        collections_to_install, missing = _find_collections_to_install(
+            all_collections, requested
+        )
+
+    destination_root = Path(destination) / "ansible_collections"
+    destination_root.mkdir(exist_ok=True)
+    current = all_collections.current
+    while not missing.is_empty():
         for collection_data in _install_missing(
             missing.get_missing_names(),
             ansible_core_version=ansible_core_version,
@@ -600,6 +719,7 @@ def setup_collections(
             collections_to_install[collection_data.full_name] = collection_data
             missing.remove(collection_data.full_name)
         missing.raise_error()
+        _add_all_dependencies(collections_to_install, missing, all_collections)
     _install_collections(
         collections_to_install.values(),
         destination_root,
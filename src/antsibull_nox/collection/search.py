@@ -12,11 +12,15 @@ from __future__ import annotations
 
 import json
 import os
+import stat
+import sys
 import threading
 import typing as t
-from collections.abc import Collection, Iterator, Sequence
+from collections.abc import Collection, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import partial
 from pathlib import Path
 
 from antsibull_fileutils.yaml import load_yaml_file
@@ -24,6 +28,12 @@ from antsibull_fileutils.yaml import load_yaml_file
 from ..ansible import AnsibleCoreVersion
 from .data import CollectionData
 
+try:
+    # orjson is considerably faster than the json module for large inputs
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads  # type: ignore[assignment]
+
 
 class Runner(t.Protocol):
     """
@@ -43,6 +53,13 @@ class Runner(t.Protocol):
 GALAXY_YML = "galaxy.yml"
 MANIFEST_JSON = "MANIFEST.json"
 
+_METADATA_CACHE_FILENAME = "collection-metadata.json"
+_METADATA_CACHE_FORMAT_VERSION = 2
+
+# Only use a thread pool to load collection metadata if there are at least
+# that many collections. For fewer, starting the threads is not worth it.
+_PARALLEL_LOAD_MIN_COLLECTIONS = 8
+
 
 @dataclass(frozen=True)
 class _GlobalCache:
@@ -68,6 +85,131 @@ class _GlobalCache:
         return self.extracted_cache / str(ansible_core_version)
 
 
+class _MetadataCache:
+    """
+    Caches the collection metadata extracted from galaxy.yml and MANIFEST.json files.
+
+    Entries are keyed by the metadata file's path, and are only used as long as
+    the file's modification time and size do not change. The cache can be stored
+    on disk so that it can be re-used by later runs. Entries for files that no
+    longer exist or have changed are dropped when storing the cache.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[int, int, dict[str, t.Any]]] = {}
+        # Entries that were validated against their file during this run
+        self._used: set[str] = set()
+        self._path: Path | None = None
+        self._modified = False
+
+    def load(self, path: Path) -> None:
+        """
+        Load cache entries from a file. Missing or invalid files are ignored.
+        """
+        self._path = path
+        try:
+            with open(path, "rb") as f:
+                data = json.load(f)
+            if data.get("format_version") != _METADATA_CACHE_FORMAT_VERSION:
+                return
+            for file, (mtime_ns, size, metadata) in data["entries"].items():
+                self._entries.setdefault(file, (mtime_ns, size, metadata))
+        except Exception:  # pylint: disable=broad-exception-caught
+            pass
+
+    def _prune(self) -> None:
+        """
+        Remove entries that were not used in this run and whose files no longer
+        exist or have changed.
+        """
+        for file, (mtime_ns, size, _) in list(self._entries.items()):
+            if file in self._used:
+                continue
+            try:
+                file_stat = os.stat(file)
+            except OSError:
+                file_stat = None
+            if (
+                file_stat is None
+                or file_stat.st_mtime_ns != mtime_ns
+                or file_stat.st_size != size
+            ):
+                del self._entries[file]
+            else:
+                self._used.add(file)
+
+    def save(self) -> None:
+        """
+        Store the cache entries in the file they were loaded from, if they changed.
+        """
+        if self._path is None or not self._modified:
+            return
+        self._prune()
+        data = {
+            "format_version": _METADATA_CACHE_FORMAT_VERSION,
+            "entries": self._entries,
+        }
+        temp_path = self._path.with_name(f"{self._path.name}.{os.getpid()}.tmp")
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(temp_path, self._path)
+            self._modified = False
+        except (OSError, TypeError, ValueError):
+            # The cache is only an optimization, so do not fail if it cannot be written
+            try:
+                temp_path.unlink()
+            except OSError:
+                pass
+
+    def get(self, file: Path, file_stat: os.stat_result) -> dict[str, t.Any] | None:
+        """
+        Retrieve cached metadata for the given file, if present and still valid.
+        """
+        key = str(file)
+        entry = self._entries.get(key)
+        if (
+            entry is None
+            or entry[0] != file_stat.st_mtime_ns
+            or entry[1] != file_stat.st_size
+        ):
+            return None
+        self._used.add(key)
+        return entry[2]
+
+    def set(
+        self, file: Path, file_stat: os.stat_result, metadata: dict[str, t.Any]
+    ) -> None:
+        """
+        Store metadata for the given file.
+        """
+        key = str(file)
+        self._entries[key] = (
+            file_stat.st_mtime_ns,
+            file_stat.st_size,
+            metadata,
+        )
+        self._used.add(key)
+        self._modified = True
+
+
+_METADATA_CACHE = _MetadataCache()
+
+
+class _MissingMetadataError(ValueError):
+    """
+    A directory contains neither galaxy.yml nor MANIFEST.json.
+    """
+
+
+def _stat_regular_file(path: Path) -> os.stat_result | None:
+    try:
+        file_stat = path.stat()
+    except OSError:
+        return None
+    return file_stat if stat.S_ISREG(file_stat.st_mode) else None
+
+
 def _load_galaxy_yml(galaxy_yml: Path) -> dict[str, t.Any]:
     try:
         data = load_yaml_file(galaxy_yml)
@@ -80,8 +222,10 @@ def _load_galaxy_yml(galaxy_yml: Path) -> dict[str, t.Any]:
 
 def _load_manifest_json_collection_info(manifest_json: Path) -> dict[str, t.Any]:
     try:
+        # MANIFEST.json files are small, so read them in one go and use the
+        # faster JSON parser if available
         with open(manifest_json, "br") as f:
-            data = json.load(f)
+            data = _json_loads(f.read())
     except Exception as exc:
         raise ValueError(f"Cannot parse {manifest_json}: {exc}") from exc
     ci = data.get("collection_info")
@@ -90,32 +234,7 @@ def _load_manifest_json_collection_info(manifest_json: Path) -> dict[str, t.Any]
     return ci
 
 
-def load_collection_data_from_disk(
-    path: Path,
-    *,
-    namespace: str | None = None,
-    name: str | None = None,
-    root: Path | None = None,
-    current: bool = False,
-    accept_manifest: bool = True,
-) -> CollectionData:
-    """
-    Load collection data from disk.
-    """
-    galaxy_yml = path / GALAXY_YML
-    manifest_json = path / MANIFEST_JSON
-    found: Path
-    if galaxy_yml.is_file():
-        found = galaxy_yml
-        data = _load_galaxy_yml(galaxy_yml)
-    elif not accept_manifest:
-        raise ValueError(f"Cannot find {GALAXY_YML} in {path}")
-    elif manifest_json.is_file():
-        found = manifest_json
-        data = _load_manifest_json_collection_info(manifest_json)
-    else:
-        raise ValueError(f"Cannot find {GALAXY_YML} or {MANIFEST_JSON} in {path}")
-
+def _extract_metadata(data: dict[str, t.Any], found: Path) -> dict[str, t.Any]:
     ns = data.get("namespace")
     if not isinstance(ns, str):
         raise ValueError(f"{found} does not contain a namespace")
@@ -128,103 +247,243 @@ def load_collection_data_from_disk(
     d = data.get("dependencies") or {}
     if not isinstance(d, dict):
         raise ValueError(f"{found}'s dependencies is not a mapping")
+    return {
+        "namespace": ns,
+        "name": n,
+        "full_name": f"{ns}.{n}",
+        "version": v,
+        "dependencies": d,
+    }
+
 
+def load_collection_data_from_disk(
+    path: Path,
+    *,
+    namespace: str | None = None,
+    name: str | None = None,
+    root: Path | None = None,
+    current: bool = False,
+    accept_manifest: bool = True,
+) -> CollectionData:
+    """
+    Load collection data from disk.
+    """
+    found = path / GALAXY_YML
+    found_stat = _stat_regular_file(found)
+    if found_stat is None:
+        if not accept_manifest:
+            raise _MissingMetadataError(f"Cannot find {GALAXY_YML} in {path}")
+        found = path / MANIFEST_JSON
+        found_stat = _stat_regular_file(found)
+        if found_stat is None:
+            raise _MissingMetadataError(
+                f"Cannot find {GALAXY_YML} or {MANIFEST_JSON} in {path}"
+            )
+
+    metadata = _METADATA_CACHE.get(found, found_stat)
+    if metadata is None:
+        if found.name == GALAXY_YML:
+            data = _load_galaxy_yml(found)
+        else:
+            data = _load_manifest_json_collection_info(found)
+        metadata = _extract_metadata(data, found)
+        _METADATA_CACHE.set(found, found_stat, metadata)
+
+    ns = metadata["namespace"]
+    n = metadata["name"]
+    v = metadata["version"]
+    d = metadata["dependencies"]
     if namespace is not None and ns != namespace:
         raise ValueError(
             f"{found} contains namespace {ns!r}, but was hoping for {namespace!r}"
         )
     if name is not None and n != name:
         raise ValueError(f"{found} contains name {n!r}, but was hoping for {name!r}")
+    # The names are used as dictionary keys a lot, so intern them
     return CollectionData(
         collections_root_path=root,
         path=path,
-        namespace=ns,
-        name=n,
-        full_name=f"{ns}.{n}",
+        namespace=sys.intern(ns),
+        name=sys.intern(n),
+        full_name=sys.intern(metadata["full_name"]),
         version=v,
-        dependencies=d,
+        # The metadata is cached, so do not share its dependencies
+        dependencies=dict(d),
         current=current,
     )
 
 
+@dataclass(frozen=True)
+class _CollectionCandidate:
+    """
+    A directory that possibly contains a collection.
+    """
+
+    path: Path
+    namespace: str
+    name: str
+    root: Path | None = None
+
+
+def _try_load_collection_candidate(
+    candidate: _CollectionCandidate,
+    *,
+    directories_without_metadata: set[str],
+) -> CollectionData | None:
+    path = os.fspath(candidate.path)
+    if path in directories_without_metadata:
+        return None
+    try:
+        return load_collection_data_from_disk(
+            candidate.path,
+            namespace=candidate.namespace,
+            name=candidate.name,
+            root=candidate.root,
+        )
+    except _MissingMetadataError:
+        directories_without_metadata.add(path)
+        return None
+    except Exception:  # pylint: disable=broad-exception-caught
+        # If the candidate doesn't happen to be a (symlink to a) directory,
+        # is not readable, does not contain a collection, ...
+        return None
+
+
+def _load_collection_candidates(
+    candidates: Sequence[_CollectionCandidate],
+    *,
+    directories_without_metadata: set[str] | None = None,
+) -> Iterator[CollectionData]:
+    """
+    Load all candidates that contain collections, in the order of the candidates.
+
+    Directories without collection metadata are added to
+    ``directories_without_metadata``. Different discovery sources of one search
+    can yield the same directories, so sharing this set between them avoids
+    repeatedly looking for metadata files that do not exist.
+    """
+    if directories_without_metadata is None:
+        directories_without_metadata = set()
+    load = partial(
+        _try_load_collection_candidate,
+        directories_without_metadata=directories_without_metadata,
+    )
+    results: Iterator[CollectionData | None]
+    if len(candidates) < _PARALLEL_LOAD_MIN_COLLECTIONS:
+        results = map(load, candidates)
+    else:
+        # Loading the metadata is mostly waiting for the filesystem,
+        # so this also helps with the GIL
+        with ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 1) * 4)
+        ) as executor:
+            results = iter(list(executor.map(load, candidates)))
+    for result in results:
+        if result is not None:
+            yield result
+
+
 def _list_adjacent_collections_ansible_collections_tree(
     root: Path,
     *,
     directories_to_ignore: Collection[Path] | None = None,
+    directories_without_metadata: set[str] | None = None,
 ) -> Iterator[CollectionData]:
-    directories_to_ignore = directories_to_ignore or ()
-    for namespace in root.iterdir():  # pylint: disable=too-many-nested-blocks
-        try:
-            if namespace.is_dir() or namespace.is_symlink():
-                for name in namespace.iterdir():
-                    if name in directories_to_ignore:
-                        continue
-                    try:
-                        if name.is_dir() or name.is_symlink():
-                            yield load_collection_data_from_disk(
-                                name,
-                                namespace=namespace.name,
-                                name=name.name,
-                                root=root,
-                            )
-                    except Exception:  # pylint: disable=broad-exception-caught
-                        # If name doesn't happen to be a (symlink to a) directory,
-                        # is not readable, ...
-                        pass
-        except Exception:  # pylint: disable=broad-exception-caught
-            # If namespace doesn't happen to be a (symlink to a) directory, is not readable, ...
-            pass
+    # Compare the strings from os.scandir() instead of creating a Path for every entry
+    ignore = {os.fspath(path) for path in directories_to_ignore or ()}
+    candidates: list[_CollectionCandidate] = []
+    # os.scandir() provides the file types from reading the directory,
+    # which avoids extra stat() calls for the is_dir() and is_symlink() checks
+    with os.scandir(root) as namespaces:
+        for namespace in namespaces:
+            if namespace.name.startswith("."):
+                # Hidden directories cannot be collection namespaces
+                continue
+            try:
+                # is_symlink() usually needs no system call, is_dir() does for symlinks
+                if namespace.is_symlink() or namespace.is_dir():
+                    with os.scandir(namespace.path) as names:
+                        for name in names:
+                            if name.path in ignore:
+                                continue
+                            if name.is_symlink() or name.is_dir():
+                                candidates.append(
+                                    _CollectionCandidate(
+                                        path=Path(name.path),
+                                        namespace=namespace.name,
+                                        name=name.name,
+                                        root=root,
+                                    )
+                                )
+            except Exception:  # pylint: disable=broad-exception-caught
+                # If namespace doesn't happen to be a (symlink to a) directory,
+                # is not readable, ...
+                pass
+    yield from _load_collection_candidates(
+        candidates, directories_without_metadata=directories_without_metadata
+    )
 
 
 def _list_adjacent_collections_outside_tree(
     directory: Path,
     *,
     directories_to_ignore: Collection[Path] | None = None,
+    directories_without_metadata: set[str] | None = None,
 ) -> Iterator[CollectionData]:
-    directories_to_ignore = directories_to_ignore or ()
-    for collection_dir in directory.iterdir():
-        if collection_dir in directories_to_ignore:
-            continue
-        if not collection_dir.is_dir() and not collection_dir.is_symlink():
-            continue
-        parts = collection_dir.name.split(".")
-        if len(parts) != 2:
-            continue
-        namespace, name = parts
-        if not namespace.isidentifier() or not name.isidentifier():
-            continue
-        try:
-            yield load_collection_data_from_disk(
-                collection_dir,
-                namespace=namespace,
-                name=name,
+    # Compare the strings from os.scandir() instead of creating a Path for every entry
+    ignore = {os.fspath(path) for path in directories_to_ignore or ()}
+    candidates: list[_CollectionCandidate] = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            # Check the name first, since that does not need any system call
+            parts = entry.name.split(".")
+            if len(parts) != 2:
+                continue
+            namespace, name = parts
+            if not namespace.isidentifier() or not name.isidentifier():
+                continue
+            if entry.path in ignore:
+                continue
+            if not entry.is_symlink() and not entry.is_dir():
+                continue
+            candidates.append(
+                _CollectionCandidate(
+                    path=Path(entry.path), namespace=namespace, name=name
+                )
             )
-        except Exception:  # pylint: disable=broad-exception-caught
-            # If collection_dir doesn't happen to be a (symlink to a) directory, ...
-            pass
+    yield from _load_collection_candidates(
+        candidates, directories_without_metadata=directories_without_metadata
+    )
 
 
-def _fs_list_local_collections() -> Iterator[CollectionData]:
+def _fs_list_local_collections(
+    *, directories_without_metadata: set[str] | None = None
+) -> Iterator[CollectionData]:
     root: Path | None = None
 
-    # Determine potential root
-    cwd = Path.cwd()
-    parents: Sequence[Path] = cwd.parents
-    # The ignore below is because of https://github.com/pylint-dev/astroid/issues/2864
-    # pylint: disable-next=no-member
-    if len(parents) > 2 and parents[1].name == "ansible_collections":
-        root = parents[1]
+    # Determine potential root. Work with strings and only create Path objects
+    # for the directories that are actually used.
+    cwd_str = os.getcwd()
+    parent_str = os.path.dirname(cwd_str)
+    grandparent_str = os.path.dirname(parent_str)
+    cwd = Path(cwd_str)
+    if os.path.basename(grandparent_str) == "ansible_collections":
+        root = Path(grandparent_str)
 
     # Current collection
     try:
         current = load_collection_data_from_disk(cwd, root=root, current=True)
-        # The ignore below is because of https://github.com/pylint-dev/astroid/issues/2864
-        # pylint: disable-next=no-member
-        if root and current.namespace == parents[0].name and current.name == cwd.name:
+        if (
+            root
+            and current.namespace == os.path.basename(parent_str)
+            and current.name == os.path.basename(cwd_str)
+        ):
             yield current
         else:
+            # The metadata does not depend on the root, so there is no need
+            # to load it a second time
             root = None
-            current = load_collection_data_from_disk(cwd, current=True)
+            current = replace(current, collections_root_path=None)
             yield current
     except Exception as exc:
         raise ValueError(
@@ -234,11 +493,15 @@ def _fs_list_local_collections() -> Iterator[CollectionData]:
     # Search tree
     if root:
         yield from _list_adjacent_collections_ansible_collections_tree(
-            root, directories_to_ignore=(cwd,)
+            root,
+            directories_to_ignore=(cwd,),
+            directories_without_metadata=directories_without_metadata,
         )
-    elif len(parents) > 0:
+    elif parent_str != cwd_str:
         yield from _list_adjacent_collections_outside_tree(
-            parents[0], directories_to_ignore=(cwd,)
+            Path(parent_str),
+            directories_to_ignore=(cwd,),
+            directories_without_metadata=directories_without_metadata,
         )
     else:
         # Only happens if cwd == "/"
@@ -246,13 +509,17 @@ def _fs_list_local_collections() -> Iterator[CollectionData]:
 
 
 def _fs_list_global_cache(global_cache_dir: Path) -> Iterator[CollectionData]:
-    if not global_cache_dir.is_dir():
-        return
-
-    yield from _list_adjacent_collections_outside_tree(global_cache_dir)
+    # Let os.scandir() find out whether the directory exists,
+    # instead of checking with an extra stat() first
+    try:
+        yield from _list_adjacent_collections_outside_tree(global_cache_dir)
+    except (FileNotFoundError, NotADirectoryError):
+        pass
 
 
-def _galaxy_list_collections_compat(runner: Runner) -> Iterator[CollectionData]:
+def _galaxy_list_collections_compat(
+    runner: Runner, *, directories_without_metadata: set[str] | None = None
+) -> Iterator[CollectionData]:
     # Handle ansible-core 2.10 and other old ansible-core verisons
     # that do not know about '--format json'.
     try:
@@ -269,6 +536,7 @@ def _galaxy_list_collections_compat(runner: Runner) -> Iterator[CollectionData]:
                 f" Standard error output: {stderr.decode('utf-8')}"
             )
         root: Path | None = None
+        candidates: list[_CollectionCandidate] = []
         for line in stdout.decode("utf-8").splitlines():
             parts = line.split(maxsplit=1)
             if len(parts) < 2:
@@ -276,20 +544,21 @@ def _galaxy_list_collections_compat(runner: Runner) -> Iterator[CollectionData]:
             if parts[0] == "#":
                 root = Path(parts[1])
             elif root is not None:
-                collection_name = parts[0]
-                if "." in collection_name:
-                    namespace, name = collection_name.split(".", 2)
-                    try:
-                        yield load_collection_data_from_disk(
-                            root / namespace / name,
+                namespace, sep, name = parts[0].partition(".")
+                if sep:
+                    candidates.append(
+                        _CollectionCandidate(
+                            path=Path(root, namespace, name),
                             namespace=namespace,
                             name=name,
                             root=root,
-                            current=False,
                         )
-                    except:  # noqa: E722, pylint: disable=bare-except
-                        # Looks like Ansible passed crap on to us...
-                        pass
+                    )
+        # Candidates that cannot be loaded are skipped;
+        # looks like Ansible passed crap on to us...
+        yield from _load_collection_candidates(
+            candidates, directories_without_metadata=directories_without_metadata
+        )
     except Exception as exc:
         raise ValueError(
             f"Error while loading collection list with compatibility handling: {exc}"
@@ -297,7 +566,10 @@ def _galaxy_list_collections_compat(runner: Runner) -> Iterator[CollectionData]:
 
 
 def _galaxy_list_collections(
-    runner: Runner, *, use_venv_if_present: bool = True
+    runner: Runner,
+    *,
+    use_venv_if_present: bool = True,
+    directories_without_metadata: set[str] | None = None,
 ) -> Iterator[CollectionData]:
     try:
         stdout, stderr, rc = runner(
@@ -313,10 +585,16 @@ def _galaxy_list_collections(
             # This happens for Ansible 2.9, where there is no 'list' command at all.
             # Avoid using ansible-galaxy from the virtual environment, and hope it is
             # installed somewhere more globally...
-            yield from _galaxy_list_collections(runner, use_venv_if_present=False)
+            yield from _galaxy_list_collections(
+                runner,
+                use_venv_if_present=False,
+                directories_without_metadata=directories_without_metadata,
+            )
             return
         if rc == 2 and b"error: unrecognized arguments: --format" in stderr:
-            yield from _galaxy_list_collections_compat(runner)
+            yield from _galaxy_list_collections_compat(
+                runner, directories_without_metadata=directories_without_metadata
+            )
             return
         if rc == 5 and b"None of the provided paths were usable." in stderr:
             # Due to a bug in ansible-galaxy collection list, ansible-galaxy
@@ -329,22 +607,27 @@ def _galaxy_list_collections(
                 f"Unexpected return code {rc} when listing collections."
                 f" Standard error output: {stderr.decode('utf-8')}"
             )
-        data = json.loads(stdout)
+        data = _json_loads(stdout)
+        candidates: list[_CollectionCandidate] = []
         for collections_root_path, collections in data.items():
             root = Path(collections_root_path)
             for collection in collections:
-                namespace, name = collection.split(".", 1)
-                try:
-                    yield load_collection_data_from_disk(
-                        root / namespace / name,
+                namespace, _, name = collection.partition(".")
+                candidates.append(
+                    _CollectionCandidate(
+                        # Build the path in one go instead of creating
+                        # an intermediate Path object for root / namespace
+                        path=Path(collections_root_path, namespace, name),
                         namespace=namespace,
                         name=name,
                         root=root,
-                        current=False,
                     )
-                except:  # noqa: E722, pylint: disable=bare-except
-                    # Looks like Ansible passed crap on to us...
-                    pass
+                )
+        # Candidates that cannot be loaded are skipped;
+        # looks like Ansible passed crap on to us...
+        yield from _load_collection_candidates(
+            candidates, directories_without_metadata=directories_without_metadata
+        )
     except Exception as exc:
         raise ValueError(f"Error while loading collection list: {exc}") from exc
 
@@ -366,7 +649,9 @@ class CollectionList:
 
         One of the collections must have the ``current`` flag set.
         """
-        collections = sorted(collections_map.values(), key=lambda cli: cli.full_name)
+        # The keys are the collections' full names, so sorting them directly
+        # avoids calling a key function for every collection
+        collections = [collections_map[name] for name in sorted(collections_map)]
         current = next(c for c in collections if c.current)
         return cls(
             collections=collections,
@@ -375,18 +660,48 @@ class CollectionList:
         )
 
     @classmethod
-    def collect_global(cls, *, runner: Runner) -> CollectionList:
+    def collect_filesystem(cls) -> CollectionList:
         """
-        Search for a global list of collections. The result is not cached.
+        Search for the current collection and collections next to it in the filesystem.
+        In contrast to ``collect_global()``, ``ansible-galaxy`` is not used.
+        The result is not cached.
         """
         found_collections = {}
         for collection_data in _fs_list_local_collections():
             found_collections[collection_data.full_name] = collection_data
-        if os.environ.get("ANTSIBULL_NOX_IGNORE_INSTALLED_COLLECTIONS") != "true":
-            for collection_data in _galaxy_list_collections(runner):
-                # Similar to Ansible, we use the first match
-                if collection_data.full_name not in found_collections:
-                    found_collections[collection_data.full_name] = collection_data
+        return cls.create(found_collections)
+
+    @classmethod
+    def collect_global(cls, *, runner: Runner) -> CollectionList:
+        """
+        Search for a global list of collections. The result is not cached.
+        """
+        found_collections = {}
+        # Shared by the filesystem and the ansible-galaxy search of this call,
+        # since ansible-galaxy often also reports the collections next to the
+        # current one
+        directories_without_metadata: set[str] = set()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Run ansible-galaxy in the background while searching the filesystem
+            galaxy_collections = None
+            if os.environ.get("ANTSIBULL_NOX_IGNORE_INSTALLED_COLLECTIONS") != "true":
+                galaxy_collections = executor.submit(
+                    lambda: list(
+                        _galaxy_list_collections(
+                            runner,
+                            directories_without_metadata=directories_without_metadata,
+                        )
+                    )
+                )
+            for collection_data in _fs_list_local_collections(
+                directories_without_metadata=directories_without_metadata
+            ):
+                found_collections[collection_data.full_name] = collection_data
+            if galaxy_collections is not None:
+                for collection_data in galaxy_collections.result():
+                    # Similar to Ansible, we use the first match
+                    if collection_data.full_name not in found_collections:
+                        found_collections[collection_data.full_name] = collection_data
         return cls.create(found_collections)
 
     @classmethod
@@ -400,12 +715,23 @@ class CollectionList:
         """
         Search for a list of collections from a local cache path. The result is not cached.
         """
+        return cls._create_local(
+            current=current,
+            collections=_fs_list_global_cache(
+                global_cache.get_extracted_path(
+                    ansible_core_version=ansible_core_version
+                )
+            ),
+        )
+
+    @classmethod
+    def _create_local(
+        cls, *, current: CollectionData, collections: Iterable[CollectionData]
+    ) -> CollectionList:
         found_collections = {
             current.full_name: current,
         }
-        for collection_data in _fs_list_global_cache(
-            global_cache.get_extracted_path(ansible_core_version=ansible_core_version)
-        ):
+        for collection_data in collections:
             # Similar to Ansible, we use the first match
             if collection_data.full_name not in found_collections:
                 found_collections[collection_data.full_name] = collection_data
@@ -495,10 +821,15 @@ class _CollectionListSingleton:
     _lock = threading.Lock()
 
     _global_cache_dir: Path | None = None
+    _global_cache: _GlobalCache | None = None
+    _filesystem_collection_list: CollectionList | None = None
     _global_collection_list: CollectionList | None = None
     _global_collection_list_per_ansible_core_version: dict[
         AnsibleCoreVersion, CollectionList
     ] = {}
+    _merged_collection_list_per_ansible_core_version: dict[
+        AnsibleCoreVersion, CollectionList
+    ] = {}
 
     def setup(self, *, global_cache_dir: Path) -> None:
         """
@@ -513,6 +844,8 @@ class _CollectionListSingleton:
                     "Setup mismatch: global cache dir cannot be both"
                     f" {self._global_cache_dir} and {global_cache_dir}"
                 )
+            if self._global_cache_dir is None:
+                _METADATA_CACHE.load(global_cache_dir / _METADATA_CACHE_FILENAME)
             self._global_cache_dir = global_cache_dir
 
     def clear(self) -> None:
@@ -520,8 +853,10 @@ class _CollectionListSingleton:
         Clear collection cache.
         """
         with self._lock:
+            self._filesystem_collection_list = None
             self._global_collection_list = None
             self._global_collection_list_per_ansible_core_version.clear()
+            self._merged_collection_list_per_ansible_core_version.clear()
 
     def get_cached(
         self, *, ansible_core_version: AnsibleCoreVersion | None = None
@@ -536,32 +871,72 @@ class _CollectionListSingleton:
             ansible_core_version
         )
 
+    def get_filesystem(self) -> CollectionList:
+        """
+        Search for a list of collections in the filesystem only. The result is cached.
+        Do not modify the result!
+        """
+        with self._lock:
+            if self._global_cache_dir is None:
+                raise ValueError("Internal error: global cache dir not setup")
+            fs_list = self._filesystem_collection_list
+            if fs_list is None:
+                fs_list = CollectionList.collect_filesystem()
+                self._filesystem_collection_list = fs_list
+            _METADATA_CACHE.save()
+        return fs_list
+
     def get(
         self, *, ansible_core_version: AnsibleCoreVersion, runner: Runner
     ) -> CollectionList:
         """
         Search for a list of collections. The result is cached.
+        Do not modify the result!
         """
+        # Fast path without locking: merging the lists is only needed once
+        # per ansible-core version, until a collection is added
+        merged_list = self._merged_collection_list_per_ansible_core_version.get(
+            ansible_core_version
+        )
+        if merged_list is not None:
+            return merged_list
         with self._lock:
-            if self._global_cache_dir is None:
-                raise ValueError("Internal error: global cache dir not setup")
+            extracted_path = self._get_global_cache().get_extracted_path(
+                ansible_core_version=ansible_core_version
+            )
             global_list = self._global_collection_list
-            if global_list is None:
-                global_list = CollectionList.collect_global(runner=runner)
-                self._global_collection_list = global_list
             local_list = self._global_collection_list_per_ansible_core_version.get(
                 ansible_core_version
             )
-            if local_list is None:
-                local_list = CollectionList.collect_local(
-                    global_cache=_GlobalCache.create(root=self._global_cache_dir),
-                    ansible_core_version=ansible_core_version,
-                    current=global_list.current,
-                )
-                self._global_collection_list_per_ansible_core_version[
-                    ansible_core_version
-                ] = local_list
-        return global_list.merge_with(local_list)
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                # Search the global cache while looking for the other collections.
+                # The local list can only be created once the current collection
+                # is known, but searching the global cache does not need that.
+                cached_collections = None
+                if local_list is None:
+                    cached_collections = executor.submit(
+                        lambda: list(_fs_list_global_cache(extracted_path))
+                    )
+                if global_list is None:
+                    global_list = CollectionList.collect_global(runner=runner)
+                    self._global_collection_list = global_list
+                if local_list is None:
+                    # pylint: disable-next=protected-access
+                    local_list = CollectionList._create_local(
+                        current=global_list.current,
+                        collections=(
+                            cached_collections.result() if cached_collections else ()
+                        ),
+                    )
+                    self._global_collection_list_per_ansible_core_version[
+                        ansible_core_version
+                    ] = local_list
+            _METADATA_CACHE.save()
+            merged_list = global_list.merge_with(local_list)
+            self._merged_collection_list_per_ansible_core_version[
+                ansible_core_version
+            ] = merged_list
+        return merged_list
 
     def _get_global_cache(self) -> _GlobalCache:
         """
@@ -569,7 +944,12 @@ class _CollectionListSingleton:
         """
         if self._global_cache_dir is None:
             raise ValueError("Internal error: global cache dir not setup")
-        return _GlobalCache.create(root=self._global_cache_dir)
+        # The global cache object is immutable, so create it only once
+        global_cache = self._global_cache
+        if global_cache is None or global_cache.root != self._global_cache_dir:
+            global_cache = _GlobalCache.create(root=self._global_cache_dir)
+            self._global_cache = global_cache
+        return global_cache
 
     def _add_collection(
         self,
@@ -590,7 +970,11 @@ class _CollectionListSingleton:
                 f"Internal error: collections not listed for {ansible_core_version}"
             )
         data = load_collection_data_from_disk(directory, namespace=namespace, name=name)
+        _METADATA_CACHE.save()
         local_list._add(data)  # pylint: disable=protected-access
+        self._merged_collection_list_per_ansible_core_version.pop(
+            ansible_core_version, None
+        )
         return data
 
     @contextmanager
@@ -633,6 +1017,7 @@ def get_collection_list(
 ) -> CollectionList:
     """
     Search for a list of collections. The result is cached.
+    Do not modify the result!
     """
     _COLLECTION_LIST.setup(global_cache_dir=global_cache_dir)
     return _COLLECTION_LIST.get(
@@ -640,8 +1025,21 @@ def get_collection_list(
     )
 
 
+def get_filesystem_collection_list(*, global_cache_dir: Path) -> CollectionList:
+    """
+    Search for the current collection and collections next to it in the filesystem,
+    without asking ``ansible-galaxy`` for installed collections. The result is cached.
+
+    Collections in this list take precedence over all others in the result
+    of ``get_collection_list()``.
+    """
+    _COLLECTION_LIST.setup(global_cache_dir=global_cache_dir)
+    return _COLLECTION_LIST.get_filesystem()
+
+
 __all__ = [
     "CollectionList",
     "get_collection_list",
+    "get_filesystem_collection_list",
     "load_collection_data_from_disk",
 ]
@@ -36,6 +36,11 @@ except ImportError:
 
 CONFIG_FILENAME = "antsibull-nox.toml"
 
+# Cache of loaded config files. Maps the path to the file's mtime and size
+# when it was loaded, and to the resulting config. Since the config models are
+# frozen, the same config object can be returned for the same unchanged file.
+_LOADED_CONFIGS: dict[str, tuple[int, int, Config]] = {}
+
 
 def _parse_version(value: t.Any) -> Version:
     if isinstance(value, Version):
@@ -676,7 +681,7 @@ class SessionAnsibleTestIntegrationWDefaultContainer(_BaseModel):
 
     @p.model_validator(mode="after")
     def _validate_core_keys(self) -> t.Self:
-        branch_names = [dlb.branch for dlb in self.add_devel_like_branches]
+        branch_names = {dlb.branch for dlb in self.add_devel_like_branches}
         for key in self.core_python_versions:
             if isinstance(key, Version) or key in {"devel", "milestone"}:
                 continue
@@ -893,12 +898,23 @@ def load_config_from_toml(path: str | os.PathLike) -> Config:
     """
     Load a config TOML file.
     """
+    key = os.path.abspath(path)
     with open(path, "rb") as f:
+        stat = os.fstat(f.fileno())
+        cached = _LOADED_CONFIGS.get(key)
+        if (
+            cached is not None
+            and cached[0] == stat.st_mtime_ns
+            and cached[1] == stat.st_size
+        ):
+            return cached[2]
         try:
             data = _load_toml(f)
         except ValueError as exc:
             raise ValueError(f"Error while reading {path}: {exc}") from exc
-    return Config.model_validate(data)
+    config = Config.model_validate(data)
+    _LOADED_CONFIGS[key] = (stat.st_mtime_ns, stat.st_size, config)
+    return config
 
 
 def lint_config_toml_messages() -> list[Message]:
@@ -10,6 +10,7 @@
 from __future__ import annotations
 
 import os
+import re
 import sys
 
 from antsibull_nox.data.antsibull_nox_data_util import (
@@ -20,6 +21,18 @@ from antsibull_nox.data.antsibull_nox_data_util import (
     setup,
 )
 
+# Whitespace (other than line breaks) directly before a line break or the end
+# of the file. Line breaks are the same as for reading files in text mode.
+_TRAILING_WHITESPACE = re.compile(r"[^\S\r\n](?=\r|\n|\Z)")
+
+
+def _count_line_breaks(content: str, start: int, end: int) -> int:
+    return (
+        content.count("\n", start, end)
+        + content.count("\r", start, end)
+        - content.count("\r\n", start, end)
+    )
+
 
 def main() -> int:
     """Main entry point."""
@@ -36,27 +49,32 @@ def main() -> int:
         if path in skip_paths:
             continue
 
-        if any(path.startswith(skip_directory) for skip_directory in skip_directories):
+        # str.startswith() accepts a tuple of prefixes and checks all of them
+        if path.startswith(skip_directories):
             continue
 
         if not os.path.isfile(path):
             continue
 
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                for i, line in enumerate(f):
-                    line = line.rstrip("\n\r")
-                    if line.rstrip() != line:
-                        messages.append(
-                            Message(
-                                file=path,
-                                start=Location(line=i + 1),
-                                end=None,
-                                level="error",
-                                id=None,
-                                message="found trailing whitespace",
-                            )
-                        )
+            with open(path, "rb") as f:
+                content = f.read().decode("utf-8")
+            # Search the whole file at once, and only count lines for matches
+            line = 1
+            position = 0
+            for match in _TRAILING_WHITESPACE.finditer(content):
+                line += _count_line_breaks(content, position, match.start())
+                position = match.start()
+                messages.append(
+                    Message(
+                        file=path,
+                        start=Location(line=line),
+                        end=None,
+                        level="error",
+                        id=None,
+                        message="found trailing whitespace",
+                    )
+                )
         except UnicodeDecodeError:
             messages.append(
                 Message(
@@ -91,7 +91,8 @@ def main() -> int:
         if path in skip_paths:
             continue
 
-        if any(path.startswith(skip_directory) for skip_directory in skip_directories):
+        # str.startswith() accepts a tuple of prefixes and checks all of them
+        if path.startswith(skip_directories):
             continue
 
         if os.path.islink(path):
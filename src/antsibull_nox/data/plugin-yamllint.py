@@ -10,12 +10,13 @@
 from __future__ import annotations
 
 import ast
-import io
+import functools
 import os
 import re
 import sys
 import traceback
 import typing as t
+from concurrent.futures import ProcessPoolExecutor
 
 import yaml
 from antsibull_nox_data_util import (  # type: ignore
@@ -34,10 +35,18 @@ REPORT_LEVELS: dict[PROBLEM_LEVELS, Level] = {
     "error": "error",
 }
 
-EXAMPLES_FMT_RE = re.compile(r"^# fmt:\s+(\S+)")
+# Leading whitespace is part of the expression, so that the (potentially long)
+# string does not have to be copied by lstrip()
+EXAMPLES_FMT_RE = re.compile(r"^\s*# fmt:\s+(\S+)")
 
 EXAMPLES_SECTION = "EXAMPLES"
 
+DOCS_SECTIONS = ("DOCUMENTATION", EXAMPLES_SECTION, "RETURN")
+
+# Only use multiple processes if there are at least that many files.
+# For fewer files, starting the worker processes takes longer than linting.
+PARALLEL_MIN_FILES = 64
+
 
 def lint(
     *,
@@ -59,11 +68,7 @@ def lint(
         col_offset = 0
 
     try:
-        problems = linter.run(
-            io.StringIO(data),
-            config,
-            path,
-        )
+        problems = linter.run(data, config, path)
         for problem in problems:
             level = REPORT_LEVELS.get(problem.level)
             if level is None:
@@ -130,9 +135,19 @@ def process_python_file(
     config: YamlLintConfig,
     config_examples: YamlLintConfig,
 ) -> None:
+    is_doc_fragment = path.startswith("plugins/doc_fragments/")
+
     try:
         with open(path, "rt", encoding="utf-8") as f:
-            root = ast.parse(f.read(), filename=path)
+            content = f.read()
+        # Parsing Python code is a lot more expensive than searching the code, so
+        # skip files that cannot contain any of the sections we are looking for.
+        # Doc fragments can use arbitrary names, so they are always parsed.
+        if not is_doc_fragment and not any(
+            section in content for section in DOCS_SECTIONS
+        ):
+            return
+        root = ast.parse(content, filename=path)
     except Exception as exc:
         messages.append(
             Message(
@@ -149,8 +164,6 @@ def process_python_file(
         )
         return
 
-    is_doc_fragment = path.startswith("plugins/doc_fragments/")
-
     # We look for top-level assignments and classes
     for child in root.body:
         if (
@@ -174,7 +187,7 @@ def process_python_file(
         if not isinstance(child, ast.Assign):
             continue
         for constant, data, section in iterate_targets(child):
-            if section not in ("DOCUMENTATION", "EXAMPLES", "RETURN"):
+            if section not in DOCS_SECTIONS:
                 continue
 
             # Handle special values
@@ -185,7 +198,7 @@ def process_python_file(
 
             # Check for non-YAML examples
             if section == EXAMPLES_SECTION:
-                fmt_match = EXAMPLES_FMT_RE.match(data.lstrip())
+                fmt_match = EXAMPLES_FMT_RE.match(data)
                 if fmt_match and fmt_match.group(1) != "yaml":
                     continue
 
@@ -234,7 +247,7 @@ def process_sidecar_docs_file(
         return
 
     # Check for non-YAML examples
-    fmt_match = EXAMPLES_FMT_RE.match(examples.lstrip())
+    fmt_match = EXAMPLES_FMT_RE.match(examples)
     if fmt_match and fmt_match.group(1) != "yaml":
         return
 
@@ -251,12 +264,10 @@ def process_sidecar_docs_file(
     )
 
 
-def main() -> int:
-    """Main entry point."""
-    paths, extra_data = setup()
-    config: str | None = extra_data.get("config")
-    config_examples: str | None = extra_data.get("config_examples")
-
+@functools.cache
+def load_configs(
+    config: str | None, config_examples: str | None
+) -> tuple[YamlLintConfig, YamlLintConfig]:
     if config:
         yamllint_config = YamlLintConfig(file=config)
     else:
@@ -267,16 +278,47 @@ def main() -> int:
     else:
         yamllint_config_examples = yamllint_config
 
+    return yamllint_config, yamllint_config_examples
+
+
+def process_file(
+    path: str, *, config: str | None, config_examples: str | None
+) -> list[Message]:
+    # The configs are passed by filename, since this can run in a worker process
+    yamllint_config, yamllint_config_examples = load_configs(config, config_examples)
     messages: list[Message] = []
-    for path in paths:
-        if not os.path.isfile(path):
-            continue
-        if path.endswith(".py"):
-            process_python_file(
-                messages, path, yamllint_config, yamllint_config_examples
-            )
-        if path.endswith((".yml", ".yaml")):
-            process_sidecar_docs_file(messages, path, yamllint_config_examples)
+    if not os.path.isfile(path):
+        return messages
+    if path.endswith(".py"):
+        process_python_file(messages, path, yamllint_config, yamllint_config_examples)
+    if path.endswith((".yml", ".yaml")):
+        process_sidecar_docs_file(messages, path, yamllint_config_examples)
+    return messages
+
+
+def main() -> int:
+    """Main entry point."""
+    paths, extra_data = setup()
+    config: str | None = extra_data.get("config")
+    config_examples: str | None = extra_data.get("config_examples")
+
+    # Load the configs once in this process, so that errors are reported here
+    load_configs(config, config_examples)
+    process = functools.partial(
+        process_file, config=config, config_examples=config_examples
+    )
+
+    messages: list[Message] = []
+    workers = os.cpu_count() or 1
+    if len(paths) < PARALLEL_MIN_FILES or workers < 2:
+        for path_messages in map(process, paths):
+            messages.extend(path_messages)
+    else:
+        # The files can be linted independently, and linting is CPU bound
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(1, len(paths) // (workers * 4))
+            for path_messages in executor.map(process, paths, chunksize=chunksize):
+                messages.extend(path_messages)
 
     return report_result(messages)
 
@@ -9,7 +9,6 @@
 
 from __future__ import annotations
 
-import io
 import os
 import sys
 import traceback
@@ -52,11 +51,7 @@ def lint(
 ) -> None:
     try:
         lines = data.splitlines()
-        problems = linter.run(
-            io.StringIO(data),
-            config,
-            path,
-        )
+        problems = linter.run(data, config, path)
         for problem in problems:
             level = REPORT_LEVELS.get(problem.level)
             if level is None:
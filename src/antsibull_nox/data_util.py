@@ -11,6 +11,7 @@ Utility code for scripts in data.
 from __future__ import annotations
 
 import json
+import os
 import typing as t
 from pathlib import Path
 
@@ -28,11 +29,24 @@ def prepare_data_script(
     Prepare a data JSON file for the extra sanity check scripts.
     """
     cwd = Path.cwd()
-    data = {}
-    data["paths"] = [str(path.relative_to(cwd)) for path in paths]
+    # Most paths are below cwd, so we can simply cut off the prefix.
+    # Only use Path.relative_to() for the others.
+    cwd_prefix = os.path.join(cwd, "")
+    cwd_len = len(cwd_prefix)
+    relative_paths = []
+    for path in paths:
+        path_str = os.fspath(path)
+        if path_str.startswith(cwd_prefix):
+            relative_paths.append(path_str[cwd_len:])
+        else:
+            relative_paths.append(str(path.relative_to(cwd)))
+    data: dict[str, t.Any] = {}
+    data["paths"] = relative_paths
     if extra_data:
         data.update(extra_data)
     file = Path(session.create_tmp()) / f"{base_name}-data.json"
+    # json.dumps() encodes everything in one go, while json.dump()
+    # writes many small chunks to the file
     with open(file, "w", encoding="utf-8") as f:
-        json.dump(data, f)
+        f.write(json.dumps(data))
     return file
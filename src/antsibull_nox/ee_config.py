@@ -10,7 +10,6 @@ Execution environment definition generator.
 from __future__ import annotations
 
 import typing as t
-from copy import deepcopy
 from pathlib import Path
 
 from antsibull_fileutils.yaml import store_yaml_file
@@ -25,14 +24,15 @@ def find_dict(destination: dict[str, t.Any], path: list[str]) -> dict[str, t.Any
     Find/create dictionary determined by ``path`` in ``destination``.
     """
     for index, key in enumerate(path):
-        if key not in destination:
-            destination[key] = {}
-        if not isinstance(destination[key], dict):
+        value = destination.get(key)
+        if value is None and key not in destination:
+            value = destination[key] = {}
+        elif not isinstance(value, dict):
             raise ValueError(
                 f"Expected a dictionary at {'.'.join(path[:index + 1])},"
-                f" but found {type(destination[key])}"
+                f" but found {type(value)}"
             )
-        destination = destination[key]
+        destination = value
     return destination
 
 
@@ -53,7 +53,13 @@ def generate_ee_config(
     """
     Create execution environment definition.
     """
-    config = deepcopy(ee_config)
+    # Only the dependencies and the additional build files are modified,
+    # so there is no need to copy the whole config
+    config = dict(ee_config)
+    if isinstance(config.get("dependencies"), dict):
+        config["dependencies"] = dict(config["dependencies"])
+    if isinstance(config.get("additional_build_files"), list):
+        config["additional_build_files"] = list(config["additional_build_files"])
 
     if config.get("version") not in ALLOWED_EE_DEFINITION_VERSIONS:
         raise ValueError(f"Invalid EE definition version {config.get('version')!r}")
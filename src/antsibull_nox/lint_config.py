@@ -149,7 +149,8 @@ def lint_config() -> list[str]:
     """
     errors = lint_config_toml()
     errors.extend(lint_noxfile())
-    return sorted(errors)
+    errors.sort()
+    return errors
 
 
 def lint_config_messages() -> list[Message]:
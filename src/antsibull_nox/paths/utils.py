@@ -14,12 +14,13 @@ import atexit
 import functools
 import os
 import shutil
+import stat
 import sys
 import typing as t
 from collections.abc import Sequence
 from pathlib import Path
 
-from antsibull_fileutils.copier import Copier, GitCopier
+from antsibull_fileutils.copier import Copier, CopierError, GitCopier
 from antsibull_fileutils.tempfile import (
     ansible_mkdtemp,
     find_tempdir,
@@ -71,13 +72,138 @@ def list_all_files() -> list[Path]:
 def remove_path(path: Path) -> None:
     """
     Delete a path.
+
+    Directories are removed recursively. Symlinks are removed themselves,
+    their targets are not touched. Does nothing if the path does not exist.
     """
-    if not path.is_symlink() and path.is_dir():
+    # Use a single lstat() instead of is_symlink(), is_dir(), and exists().
+    # This also removes dangling symlinks.
+    try:
+        path_stat = path.lstat()
+    except FileNotFoundError:
+        return
+    if stat.S_ISDIR(path_stat.st_mode):
+        # On platforms that support it, shutil.rmtree() already uses os.scandir()
+        # and file descriptor based unlink()/rmdir() calls
         shutil.rmtree(path)
-    elif path.exists():
+    else:
         path.unlink()
 
 
+_COPY_COLLECTION_EXCLUDE_ROOT = (".nox", ".tox")
+
+
+def _list_regular_files_to_copy(
+    source: Path, *, vcs: str | None
+) -> tuple[dict[str, os.stat_result], set[str]] | None:
+    """
+    List the files and directories that ``copy_collection()`` copies,
+    relative to ``source``.
+
+    Returns ``None`` if the source contains something else than regular files
+    and directories, like symlinks or Git submodules. These need the full copier.
+    """
+    names: list[str] = []
+    directories = {""}
+    if vcs == "git":
+        try:
+            git_files = list_git_files(source)
+        except ValueError as exc:
+            # Raise the same error as GitCopier
+            raise CopierError(
+                f"Error while listing files not ignored by Git in {source}: {exc}"
+            ) from exc
+        names = [
+            name
+            for name in (file.decode("utf-8") for file in git_files)
+            if name.split("/", 1)[0] not in _COPY_COLLECTION_EXCLUDE_ROOT
+        ]
+    else:
+        for root, dirs, files in os.walk(source):
+            directory = os.path.relpath(root, source)
+            if directory == ".":
+                directory = ""
+                dirs[:] = [d for d in dirs if d not in _COPY_COLLECTION_EXCLUDE_ROOT]
+                files = [f for f in files if f not in _COPY_COLLECTION_EXCLUDE_ROOT]
+            names.extend(os.path.join(directory, file) for file in files)
+            for name in dirs:
+                if os.path.islink(os.path.join(root, name)):
+                    # os.walk() does not descend into symlinks to directories
+                    return None
+                directories.add(os.path.join(directory, name))
+    files_result: dict[str, os.stat_result] = {}
+    for name in names:
+        try:
+            file_stat = os.lstat(os.path.join(source, name))
+        except FileNotFoundError:
+            # Git lists deleted files that have not been staged yet
+            continue
+        if not stat.S_ISREG(file_stat.st_mode):
+            return None
+        files_result[name] = file_stat
+        directory = os.path.dirname(name)
+        while directory not in directories:
+            directories.add(directory)
+            directory = os.path.dirname(directory)
+    return files_result, directories
+
+
+def _remove_unwanted(
+    destination: Path, files: dict[str, os.stat_result], directories: set[str]
+) -> None:
+    for root, dirs, dest_files in os.walk(destination, topdown=False):
+        directory = os.path.relpath(root, destination)
+        if directory == ".":
+            directory = ""
+        for name in dest_files:
+            if os.path.join(directory, name) not in files:
+                os.unlink(os.path.join(root, name))
+        for name in dirs:
+            if os.path.join(directory, name) not in directories:
+                remove_path(Path(root, name))
+
+
+def _sync_regular_files(
+    source: Path,
+    destination: Path,
+    files: dict[str, os.stat_result],
+    directories: set[str],
+) -> None:
+    """
+    Make ``destination`` contain copies of exactly the given files and directories
+    from ``source``.
+
+    Files whose copies have the same size, mode, and modification time as the source
+    are not copied again. ``shutil.copy2()`` preserves the modification time, and
+    changing a copy changes its modification time.
+    """
+    if destination.is_symlink() or not destination.is_dir():
+        remove_path(destination)
+    else:
+        _remove_unwanted(destination, files, directories)
+    for directory in sorted(directories):
+        dest_dir = os.path.join(destination, directory) if directory else destination
+        if not os.path.isdir(dest_dir) or os.path.islink(dest_dir):
+            remove_path(Path(dest_dir))
+            os.mkdir(dest_dir, mode=0o700)
+            shutil.copystat(os.path.join(source, directory), dest_dir)
+
+    for name, source_stat in files.items():
+        dest_file = os.path.join(destination, name)
+        try:
+            dest_stat = os.lstat(dest_file)
+            if (
+                dest_stat.st_mode == source_stat.st_mode
+                and dest_stat.st_size == source_stat.st_size
+                and dest_stat.st_mtime_ns == source_stat.st_mtime_ns
+            ):
+                continue
+            remove_path(Path(dest_file))
+        except FileNotFoundError:
+            pass
+        shutil.copy2(os.path.join(source, name), dest_file)
+
+
 def copy_collection(
     source: Path, destination: Path, *, copy_repo_structure: bool = False
 ) -> None:
@@ -86,16 +212,23 @@ def copy_collection(
 
     Automatically detect supported VCSs and use their information to avoid
     copying ignored files.
+
+    If the collection only contains regular files and directories, an existing
+    copy in destination is updated incrementally.
     """
-    if destination.exists():
-        remove_path(destination)
     vcs = detect_vcs(source)
+    if not (vcs == "git" and copy_repo_structure):
+        to_copy = _list_regular_files_to_copy(source, vcs=vcs)
+        if to_copy is not None:
+            _sync_regular_files(source, destination, *to_copy)
+            return
+    remove_path(destination)
     copier: Copier
     if vcs == "git":
         copier = GitCopier(copy_repo_structure=copy_repo_structure)
     else:
         copier = Copier()
-    copier.copy(source, destination, exclude_root=[".nox", ".tox"])
+    copier.copy(source, destination, exclude_root=list(_COPY_COLLECTION_EXCLUDE_ROOT))
 
 
 def _is_acceptable_tempdir(directory: Path, excludes: Sequence[Path]) -> bool:
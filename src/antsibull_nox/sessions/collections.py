@@ -10,12 +10,24 @@ Create nox sessions.
 
 from __future__ import annotations
 
+import base64
+import hashlib
+import json
 import os
+import shutil
 import subprocess
+import time
 import typing as t
 from dataclasses import dataclass
 from pathlib import Path
 
+try:
+    import fcntl
+
+    _HAS_FCNTL = True
+except ImportError:  # pragma: no cover
+    _HAS_FCNTL = False
+
 import nox
 
 from ..ansible import AnsibleCoreVersion, parse_ansible_core_version
@@ -80,6 +92,209 @@ def _run_subprocess(
     return p.stdout, p.stderr, p.returncode
 
 
+# Commands whose results only depend on the executable, the environment,
+# the Ansible configuration, and the filesystem, and which are run by several
+# sessions.
+_CACHEABLE_COMMANDS: tuple[tuple[str, ...], ...] = (
+    ("ansible-galaxy", "collection", "list"),
+)
+# Every cache key gets its own result and lock file, so that unrelated
+# commands do not have to wait for each other
+_COMMAND_CACHE_DIRECTORY = "command-cache"
+# Only re-use command results for this many seconds. Results are also
+# invalidated when the collection roots they list change, but installing
+# collections can also create new collection roots.
+_COMMAND_CACHE_TTL = 60
+
+
+def _is_cacheable_command(args: list[str]) -> bool:
+    return any(
+        len(args) >= len(command)
+        and Path(args[0]).name == command[0]
+        and tuple(args[1 : len(command)]) == command[1:]
+        for command in _CACHEABLE_COMMANDS
+    )
+
+
+def _get_ansible_config_candidates() -> list[str]:
+    """
+    Return the paths ansible-core looks for ansible.cfg in, in order.
+    """
+    candidates = []
+    if ansible_config := os.environ.get("ANSIBLE_CONFIG"):
+        ansible_config = os.path.expanduser(ansible_config)
+        if os.path.isdir(ansible_config):
+            ansible_config = os.path.join(ansible_config, "ansible.cfg")
+        candidates.append(os.path.abspath(ansible_config))
+    candidates.append(os.path.abspath("ansible.cfg"))
+    candidates.append(os.path.expanduser("~/.ansible.cfg"))
+    candidates.append("/etc/ansible/ansible.cfg")
+    return candidates
+
+
+def _get_file_state(path: str) -> tuple[int, int] | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _get_command_cache_key(args: list[str]) -> str | None:
+    executable = shutil.which(args[0])
+    if executable is None:
+        return None
+    executable_state = _get_file_state(executable)
+    if executable_state is None:
+        return None
+    environment = sorted(
+        (name, value)
+        for name, value in os.environ.items()
+        if name.startswith("ANSIBLE_") or name in ("PATH", "HOME")
+    )
+    # Which ansible.cfg is used and what it contains determines the
+    # collection paths, so include the state of all candidates
+    ansible_configs = [
+        (path, _get_file_state(path)) for path in _get_ansible_config_candidates()
+    ]
+    data = json.dumps(
+        [
+            os.path.abspath(executable),
+            executable_state,
+            args[1:],
+            os.getcwd(),
+            environment,
+            ansible_configs,
+        ]
+    )
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def _get_listed_collection_roots(stdout: bytes) -> list[str]:
+    """
+    Extract the collection roots from the output of 'ansible-galaxy collection list'.
+    """
+    try:
+        data = json.loads(stdout)
+        if isinstance(data, dict):
+            return list(data)
+    except ValueError:
+        pass
+    # Without '--format json', every root is shown as '# <path>'
+    return [
+        line[2:].strip()
+        for line in stdout.decode("utf-8", errors="replace").splitlines()
+        if line.startswith("# ")
+    ]
+
+
+def _get_collection_root_state(root: str) -> list[t.Any] | None:
+    """
+    Return the modification times of a collection root and of its namespace
+    directories. Installing or removing a collection changes at least one of them.
+    """
+    try:
+        state: list[t.Any] = [os.stat(root).st_mtime_ns]
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    state.append([entry.name, entry.stat().st_mtime_ns])
+    except OSError:
+        return None
+    state[1:] = sorted(state[1:])
+    return state
+
+
+def _load_command_cache_entry(path: Path) -> tuple[bytes, bytes] | None:
+    try:
+        with open(path, "rb") as f:
+            data = json.load(f)
+        if not 0 <= time.time() - data["time"] < _COMMAND_CACHE_TTL:
+            return None
+        for root, state in data["roots"].items():
+            if _get_collection_root_state(root) != state:
+                return None
+        return base64.b64decode(data["stdout"]), base64.b64decode(data["stderr"])
+    except Exception:  # pylint: disable=broad-exception-caught
+        return None
+
+
+def _store_command_cache_entry(path: Path, stdout: bytes, stderr: bytes) -> None:
+    data = {
+        "time": time.time(),
+        "stdout": base64.b64encode(stdout).decode("ascii"),
+        "stderr": base64.b64encode(stderr).decode("ascii"),
+        "roots": {
+            root: _get_collection_root_state(root)
+            for root in _get_listed_collection_roots(stdout)
+        },
+    }
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(temp_path, path)
+    except OSError:
+        # The cache is only an optimization
+        try:
+            temp_path.unlink()
+        except OSError:
+            pass
+
+
+def _prune_command_cache(directory: Path, *, keep: str) -> None:
+    """
+    Remove result and lock files of other cache keys that have expired.
+    """
+    expired = time.time() - _COMMAND_CACHE_TTL
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.startswith(keep):
+                    continue
+                try:
+                    if entry.stat().st_mtime < expired:
+                        os.unlink(entry.path)
+                except OSError:
+                    pass
+    except OSError:
+        pass
+
+
+def _run_subprocess_cached(
+    args: list[str], *, check: bool, cache_dir: Path
+) -> tuple[bytes, bytes, int]:
+    """
+    Run a subprocess. Successful results are shared for a short time with
+    other antsibull-nox processes running at the same time, for example
+    other nox invocations in the same repository.
+    """
+    key = _get_command_cache_key(args)
+    if key is None or not _HAS_FCNTL:
+        return _run_subprocess(args, check=check)
+    directory = cache_dir / _COMMAND_CACHE_DIRECTORY
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        lock_file = open(directory / f"{key}.lock", "wb")
+    except OSError:
+        return _run_subprocess(args, check=check)
+    with lock_file:
+        # The lock is specific to this cache key. Holding it while running
+        # the command lets concurrent processes that want the same result
+        # wait for it instead of running the command again.
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        cache_path = directory / f"{key}.json"
+        if (entry := _load_command_cache_entry(cache_path)) is not None:
+            return entry[0], entry[1], 0
+        stdout, stderr, rc = _run_subprocess(args, check=check)
+        if rc == 0:
+            _store_command_cache_entry(cache_path, stdout, stderr)
+    # Every change of the executable or the environment results in a new key,
+    # so do not let the files of old keys accumulate
+    _prune_command_cache(directory, keep=key)
+    return stdout, stderr, rc
+
+
 def _find_executable(command: str, paths: list[str]) -> str | None:
     for path in paths:
         p = Path(path)
@@ -98,6 +313,10 @@ def _create_venv_run_subprocess(session: nox.Session) -> Runner:
             executable = _find_executable(args[0], session.bin_paths)
             if executable is not None:
                 args = [executable] + args[1:]
+        if _is_cacheable_command(args):
+            return _run_subprocess_cached(
+                args, check=check, cache_dir=Path(session.cache_dir)
+            )
         return _run_subprocess(args, check=check, use_venv_if_present=False)
 
     return run
@@ -10,11 +10,17 @@ General utilities.
 
 from __future__ import annotations
 
+import functools
 import typing as t
 from dataclasses import dataclass
 
+# Cache of parsed version strings. The same version strings are parsed over and
+# over again, so we make sure that every one of them is parsed only once.
+_PARSED_VERSIONS: dict[str, Version] = {}
 
-@dataclass(order=True, frozen=True)
+
+# Equality and ordering are implemented explicitly below
+@dataclass(frozen=True, eq=False)
 class Version:
     """
     Models a two-part version (major and minor).
@@ -23,22 +29,73 @@ class Version:
     major: int
     minor: int
 
+    # Versions are frequently used as dictionary keys, compared, and converted
+    # to strings, so compute the comparison tuple, the hash, and the string
+    # representation only once. cached_property stores them in the instance's
+    # __dict__; they are not dataclass fields, so they do not show up in
+    # asdict() or when pydantic serializes a Version.
+    @functools.cached_property
+    def _tuple(self) -> tuple[int, int]:
+        return (self.major, self.minor)
+
+    @functools.cached_property
+    def _hash(self) -> int:
+        return hash(self._tuple)
+
+    @functools.cached_property
+    def _str(self) -> str:
+        return f"{self.major}.{self.minor}"
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Version):
+            return NotImplemented
+        return self._tuple == other._tuple
+
+    def __lt__(self, other: Version) -> bool:
+        if not isinstance(other, Version):
+            return NotImplemented
+        return self._tuple < other._tuple
+
+    def __le__(self, other: Version) -> bool:
+        if not isinstance(other, Version):
+            return NotImplemented
+        return self._tuple <= other._tuple
+
+    def __gt__(self, other: Version) -> bool:
+        if not isinstance(other, Version):
+            return NotImplemented
+        return self._tuple > other._tuple
+
+    def __ge__(self, other: Version) -> bool:
+        if not isinstance(other, Version):
+            return NotImplemented
+        return self._tuple >= other._tuple
+
     @classmethod
     def parse(cls, version_string: str) -> Version:
         """
         Given a version string, parses it into a Version object.
         Other components than major and minor version are ignored.
         """
+        try:
+            return _PARSED_VERSIONS[version_string]
+        except (KeyError, TypeError):
+            pass
         try:
             major, minor = [int(v) for v in version_string.split(".")[:2]]
         except (AttributeError, ValueError) as exc:
             raise ValueError(
                 f"Cannot parse {version_string!r} as version string."
             ) from exc
-        return Version(major=major, minor=minor)
+        version = Version(major=major, minor=minor)
+        _PARSED_VERSIONS[version_string] = version
+        return version
 
     def __str__(self) -> str:
-        return f"{self.major}.{self.minor}"
+        return self._str
 
     def next_minor_version(self) -> Version:
         """
@@ -12,6 +12,7 @@ Tests for the collection.install module
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
@@ -22,6 +23,8 @@ from antsibull_nox.collection.data import (
 from antsibull_nox.collection.install import (
     _add_all_dependencies,
     _extract_collections_from_extra_deps_file,
+    _install_collection,
+    _install_current_collection,
     _MissingDependencies,
 )
 from antsibull_nox.collection.search import (
@@ -221,3 +224,74 @@ def test__extract_collections_from_extra_deps_file_fail(
     file.write_text(content)
     with pytest.raises(ValueError, match=expected_match):
         _extract_collections_from_extra_deps_file(file)
+
+
+def test__install_collection(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    source.mkdir()
+    collection = CollectionData.create(path=source, full_name="foo.bar")
+    dest = tmp_path / "dest"
+
+    _install_collection(collection, dest)
+    assert dest.readlink() == source
+
+    _install_collection(collection, dest)
+    assert dest.readlink() == source
+
+    dest.unlink()
+    dest.symlink_to(tmp_path / "other")
+    _install_collection(collection, dest)
+    assert dest.readlink() == source
+
+    dest.unlink()
+    (dest / "foo").mkdir(parents=True)
+    _install_collection(collection, dest)
+    assert dest.readlink() == source
+
+    dir_fd = os.open(tmp_path, os.O_RDONLY)
+    try:
+        dest.unlink()
+        dest.symlink_to(tmp_path / "other")
+        _install_collection(collection, dest, dir_fd=dir_fd)
+        assert dest.readlink() == source
+    finally:
+        os.close(dir_fd)
+
+
+def test__install_current_collection(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    (source / "plugins").mkdir(parents=True)
+    (source / "galaxy.yml").write_text("")
+    (source / ".nox").mkdir()
+    collection = CollectionData.create(path=source, full_name="foo.bar", current=True)
+    dest = tmp_path / "root" / "ansible_collections" / "foo" / "bar"
+    dest.parent.mkdir(parents=True)
+
+    def check() -> None:
+        assert sorted(p.name for p in dest.iterdir()) == ["galaxy.yml", "plugins"]
+        assert (dest / "galaxy.yml").readlink() == Path("../../../../source/galaxy.yml")
+        assert (dest / "plugins").readlink() == Path("../../../../source/plugins")
+
+    _install_current_collection(collection, dest, use_relative_symlinks=True)
+    check()
+
+    # Nothing changed
+    _install_current_collection(collection, dest, use_relative_symlinks=True)
+    check()
+
+    # The installation was modified
+    (dest / "plugins").unlink()
+    (dest / "foo").write_text("")
+    _install_current_collection(collection, dest, use_relative_symlinks=True)
+    check()
+
+    # The source was modified
+    (source / "README.md").write_text("")
+    _install_current_collection(collection, dest, use_relative_symlinks=False)
+    assert sorted(p.name for p in dest.iterdir()) == [
+        "README.md",
+        "galaxy.yml",
+        "plugins",
+    ]
+    assert (dest / "README.md").readlink() == source / "README.md"
+    assert (dest / "plugins").readlink() == source / "plugins"
@@ -24,7 +24,9 @@ from antsibull_nox.collection.search import (
     _COLLECTION_LIST,
     _fs_list_local_collections,
     _galaxy_list_collections,
+    _MetadataCache,
     get_collection_list,
+    get_filesystem_collection_list,
     load_collection_data_from_disk,
 )
 
@@ -377,12 +379,35 @@ def test__galaxy_list_collections(
     assert res == expected_res
 
 
+def test__fs_list_local_collections_without_metadata(tmp_path: Path) -> None:
+    root = tmp_path / "ansible_collections"
+    root.mkdir()
+    foo_bar = create_collection_w_dir(root, namespace="foo", name="bar")
+    (root / "foo" / "baz").mkdir()
+    directories_without_metadata: set[str] = set()
+    with chdir(foo_bar):
+        result = list(
+            _fs_list_local_collections(
+                directories_without_metadata=directories_without_metadata
+            )
+        )
+    assert [c.full_name for c in result] == ["foo.bar"]
+    assert directories_without_metadata == {str(root / "foo" / "baz")}
+
+    # Directories without metadata are only remembered during one search
+    (root / "foo" / "baz" / "galaxy.yml").write_text("namespace: foo\nname: baz\n")
+    with chdir(foo_bar):
+        result = sorted(_fs_list_local_collections(), key=lambda c: c.full_name)
+    assert [c.full_name for c in result] == ["foo.bar", "foo.baz"]
+
+
 def test__galaxy_list_collections_fail() -> None:
     with pytest.raises(
         ValueError,
         match=(
+            # The exact message depends on whether orjson is installed
             "^Error while loading collection list: "
-            "Expecting property name enclosed in double quotes: "
+            "(Expecting property name enclosed in double quotes|unexpected end of data): "
         ),
     ):
         list(
@@ -465,6 +490,7 @@ def test_get_collection_list(tmp_path) -> None:
             runner=runner, global_cache_dir=empty, ansible_core_version="devel"
         )
         assert _COLLECTION_LIST.get_cached() is cl
+        assert result_2 is result
 
         with pytest.raises(
             ValueError, match="^Setup mismatch: global cache dir cannot be both "
@@ -495,6 +521,37 @@ def test_get_collection_list(tmp_path) -> None:
     assert result == result_2
 
 
+def test_get_filesystem_collection_list(tmp_path, monkeypatch) -> None:
+    root = tmp_path / "root" / "ansible_collections"
+    empty = tmp_path / "empty"
+
+    foo_bar = create_collection_w_dir(root, namespace="foo", name="bar")
+    foo_bam = create_collection_w_dir(root, namespace="foo", name="bam")
+
+    monkeypatch.setattr(_COLLECTION_LIST, "_global_cache_dir", None)
+    with chdir(foo_bar):
+        _COLLECTION_LIST.clear()
+        result = get_filesystem_collection_list(global_cache_dir=empty)
+        assert get_filesystem_collection_list(global_cache_dir=empty) is result
+        # ansible-galaxy has not been asked for the installed collections
+        assert _COLLECTION_LIST.get_cached() is None
+        _COLLECTION_LIST.clear()
+
+    assert result.collections == [
+        CollectionData.create(
+            collections_root_path=root,
+            path=foo_bam,
+            full_name="foo.bam",
+        ),
+        CollectionData.create(
+            collections_root_path=root,
+            path=foo_bar,
+            full_name="foo.bar",
+            current=True,
+        ),
+    ]
+
+
 LOAD_COLLECTION_DATA_FROM_DISK_DATA: list[
     tuple[str, str, dict[str, t.Any], dict[str, t.Any]]
 ] = [
@@ -615,3 +672,91 @@ def test_load_collection_data_from_disk_fail(
     (tmp_path / filename).write_text(content)
     with pytest.raises(ValueError, match=expected_match):
         load_collection_data_from_disk(tmp_path, **paras)
+
+
+def test__metadata_cache(tmp_path: Path) -> None:
+    cache_file = tmp_path / "cache.json"
+    galaxy_yml = tmp_path / "galaxy.yml"
+    galaxy_yml.write_text("namespace: foo\nname: bar\n")
+    galaxy_yml_stat = galaxy_yml.stat()
+    metadata: dict[str, t.Any] = {
+        "namespace": "foo",
+        "name": "bar",
+        "version": None,
+        "dependencies": {},
+    }
+
+    cache = _MetadataCache()
+    cache.load(cache_file)
+    assert cache.get(galaxy_yml, galaxy_yml_stat) is None
+    cache.set(galaxy_yml, galaxy_yml_stat, metadata)
+    assert cache.get(galaxy_yml, galaxy_yml_stat) == metadata
+    cache.save()
+    assert cache_file.is_file()
+
+    cache_2 = _MetadataCache()
+    cache_2.load(cache_file)
+    assert cache_2.get(galaxy_yml, galaxy_yml_stat) == metadata
+
+    # Changing the file invalidates the entry
+    galaxy_yml.write_text("namespace: foo\nname: baz\nversion: 1.0.0\n")
+    assert cache_2.get(galaxy_yml, galaxy_yml.stat()) is None
+
+    # Invalid cache files are ignored
+    cache_file.write_text("{")
+    cache_3 = _MetadataCache()
+    cache_3.load(cache_file)
+    assert cache_3.get(galaxy_yml, galaxy_yml_stat) is None
+
+
+def test__metadata_cache_prune(tmp_path: Path) -> None:
+    cache_file = tmp_path / "cache.json"
+    files = {}
+    for name in ("kept", "unused", "removed", "modified"):
+        file = tmp_path / name / "galaxy.yml"
+        file.parent.mkdir()
+        file.write_text(f"namespace: foo\nname: {name}\n")
+        files[name] = file
+    metadata: dict[str, t.Any] = {
+        "namespace": "foo",
+        "name": "bar",
+        "version": None,
+        "dependencies": {},
+    }
+
+    cache = _MetadataCache()
+    cache.load(cache_file)
+    for file in files.values():
+        cache.set(file, file.stat(), metadata)
+    cache.save()
+
+    files["removed"].unlink()
+    files["modified"].write_text("namespace: foo\nname: modified\nversion: 1.0.0\n")
+    new_file = tmp_path / "new" / "galaxy.yml"
+    new_file.parent.mkdir()
+    new_file.write_text("namespace: foo\nname: new\n")
+
+    cache_2 = _MetadataCache()
+    cache_2.load(cache_file)
+    assert cache_2.get(files["kept"], files["kept"].stat()) == metadata
+    cache_2.set(new_file, new_file.stat(), metadata)
+    cache_2.save()
+
+    # Entries for removed and modified files are dropped, unused entries
+    # whose files did not change are kept
+    cache_3 = _MetadataCache()
+    cache_3.load(cache_file)
+    # pylint: disable-next=protected-access
+    assert sorted(cache_3._entries) == sorted(
+        str(file) for file in (files["kept"], files["unused"], new_file)
+    )
+
+
+def test_load_collection_data_from_disk_cached_dependencies(tmp_path: Path) -> None:
+    (tmp_path / "galaxy.yml").write_text(
+        "namespace: foo\nname: bar\ndependencies:\n  foo.baz: '*'\n"
+    )
+    collection_1 = load_collection_data_from_disk(tmp_path)
+    collection_1.dependencies["foo.other"] = "*"
+    collection_2 = load_collection_data_from_disk(tmp_path)
+    assert collection_2.dependencies == {"foo.baz": "*"}
@@ -0,0 +1,74 @@
+# Author: Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or
+# https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026, Ansible Project
+
+from __future__ import annotations
+
+import importlib.util
+import typing as t
+from pathlib import Path
+
+import pytest
+
+import antsibull_nox
+
+DATA_DIR = Path(antsibull_nox.__file__).parent / "data"
+
+
+@pytest.fixture(name="plugin_yamllint")
+def fixture_plugin_yamllint(monkeypatch: pytest.MonkeyPatch) -> t.Any:
+    # yamllint is part of the test extra
+    pytest.importorskip("yamllint")
+    # The script imports antsibull_nox_data_util from its own directory
+    monkeypatch.syspath_prepend(str(DATA_DIR))
+    spec = importlib.util.spec_from_file_location(
+        "plugin_yamllint", DATA_DIR / "plugin-yamllint.py"
+    )
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_process_file(
+    plugin_yamllint: t.Any, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    modules = tmp_path / "plugins" / "modules"
+    modules.mkdir(parents=True)
+    doc_fragments = tmp_path / "plugins" / "doc_fragments"
+    doc_fragments.mkdir(parents=True)
+
+    # Documentation is linted
+    (modules / "docs.py").write_text('DOCUMENTATION = """\n---\nfoo: bar  \n"""\n')
+    messages = plugin_yamllint.process_file(
+        "plugins/modules/docs.py", config=None, config_examples=None
+    )
+    assert [message.message for message in messages] == [
+        "DOCUMENTATION: error: trailing spaces  (trailing-spaces)"
+    ]
+
+    # Files that do not mention any documentation section are not parsed,
+    # so syntax errors in them are not reported
+    (modules / "no_docs.py").write_text("def foo(:\n")
+    assert not plugin_yamllint.process_file(
+        "plugins/modules/no_docs.py", config=None, config_examples=None
+    )
+
+    # Syntax errors are reported for files that mention a documentation section
+    (modules / "broken.py").write_text('def foo(:\nRETURN = ""\n')
+    messages = plugin_yamllint.process_file(
+        "plugins/modules/broken.py", config=None, config_examples=None
+    )
+    assert len(messages) == 1
+    assert messages[0].message.startswith("Error while parsing Python code:")
+
+    # Doc fragments are always parsed
+    (doc_fragments / "broken.py").write_text("def foo(:\n")
+    messages = plugin_yamllint.process_file(
+        "plugins/doc_fragments/broken.py", config=None, config_examples=None
+    )
+    assert len(messages) == 1
+    assert messages[0].message.startswith("Error while parsing Python code:")
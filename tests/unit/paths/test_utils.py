@@ -0,0 +1,106 @@
+# Author: Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or
+# https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026, Ansible Project
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from antsibull_fileutils.copier import CopierError
+
+import antsibull_nox.paths.utils
+from antsibull_nox.paths.utils import copy_collection, remove_path
+
+
+def test_remove_path(tmp_path: Path) -> None:
+    directory = tmp_path / "dir"
+    (directory / "sub").mkdir(parents=True)
+    (directory / "sub" / "file").write_text("content")
+    file = tmp_path / "file"
+    file.write_text("content")
+    dir_link = tmp_path / "dir-link"
+    dir_link.symlink_to(directory)
+    dangling_link = tmp_path / "dangling-link"
+    dangling_link.symlink_to(tmp_path / "does-not-exist")
+
+    remove_path(dir_link)
+    assert not dir_link.is_symlink()
+    assert (directory / "sub" / "file").is_file()
+
+    remove_path(dangling_link)
+    assert not dangling_link.is_symlink()
+
+    remove_path(file)
+    assert not file.exists()
+
+    remove_path(directory)
+    assert not directory.exists()
+
+    remove_path(tmp_path / "does-not-exist")
+    assert list(tmp_path.iterdir()) == []
+
+
+def _list_tree(path: Path) -> dict[str, str | None]:
+    return {
+        str(p.relative_to(path)): (
+            p.read_text() if p.is_file() and not p.is_symlink() else None
+        )
+        for p in sorted(path.rglob("*"))
+    }
+
+
+def test_copy_collection(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    (source / "plugins" / "modules").mkdir(parents=True)
+    (source / "plugins" / "modules" / "foo.py").write_text("foo")
+    (source / "galaxy.yml").write_text("galaxy")
+    (source / "empty").mkdir()
+    (source / ".nox").mkdir()
+    (source / ".nox" / "bar").write_text("bar")
+    dest = tmp_path / "dest"
+
+    expected = {
+        "empty": None,
+        "galaxy.yml": "galaxy",
+        "plugins": None,
+        "plugins/modules": None,
+        "plugins/modules/foo.py": "foo",
+    }
+    copy_collection(source, dest)
+    assert _list_tree(dest) == expected
+
+    # Unchanged files are not copied again
+    galaxy_inode = (dest / "galaxy.yml").stat().st_ino
+    (dest / "extra").write_text("extra")
+    (dest / "plugins" / "modules" / "foo.py").write_text("modified")
+    (source / "README.md").write_text("readme")
+    (source / "empty").rmdir()
+    copy_collection(source, dest)
+    del expected["empty"]
+    expected["README.md"] = "readme"
+    assert _list_tree(dest) == expected
+    assert (dest / "galaxy.yml").stat().st_ino == galaxy_inode
+
+    # Symlinks need a full copy
+    (source / "link").symlink_to("galaxy.yml")
+    copy_collection(source, dest)
+    expected["link"] = None
+    assert _list_tree(dest) == expected
+    assert (dest / "link").readlink() == Path("galaxy.yml")
+
+
+def test_copy_collection_git_error(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def list_git_files(directory: Path) -> list[bytes]:
+        raise ValueError("Error while running git")
+
+    monkeypatch.setattr(antsibull_nox.paths.utils, "detect_vcs", lambda path: "git")
+    monkeypatch.setattr(antsibull_nox.paths.utils, "list_git_files", list_git_files)
+    with pytest.raises(
+        CopierError, match="^Error while listing files not ignored by Git in "
+    ):
+        copy_collection(tmp_path / "source", tmp_path / "destination")
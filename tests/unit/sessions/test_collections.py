@@ -0,0 +1,160 @@
+# Author: Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or
+# https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026, Ansible Project
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from antsibull_nox.sessions.collections import (
+    _is_cacheable_command,
+    _run_subprocess_cached,
+)
+
+
+@pytest.mark.parametrize(
+    "args, expected",
+    [
+        (["ansible-galaxy", "collection", "list"], True),
+        (["/path/to/ansible-galaxy", "collection", "list", "--format", "json"], True),
+        (["ansible-galaxy", "collection", "download"], False),
+        (["ansible-galaxy", "collection"], False),
+        (["ansible-test", "collection", "list"], False),
+    ],
+)
+def test__is_cacheable_command(args: list[str], expected: bool) -> None:
+    assert _is_cacheable_command(args) == expected
+
+
+def test__run_subprocess_cached(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("ANSIBLE_CONFIG", raising=False)
+    counter = tmp_path / "counter"
+    executable = tmp_path / "ansible-galaxy"
+    executable.write_text(f"#!/bin/sh\necho x >> {counter}\necho output\n")
+    executable.chmod(0o755)
+    cache_dir = tmp_path / "cache"
+
+    for _ in range(2):
+        result = _run_subprocess_cached(
+            [str(executable), "collection", "list"], check=False, cache_dir=cache_dir
+        )
+        assert result == (b"output\n", b"", 0)
+    assert counter.read_text() == "x\n"
+
+    # Different arguments are cached separately
+    _run_subprocess_cached(
+        [str(executable), "collection", "list", "--format", "json"],
+        check=False,
+        cache_dir=cache_dir,
+    )
+    assert counter.read_text() == "x\nx\n"
+
+    # Changing the executable invalidates the cache
+    stat = executable.stat()
+    os.utime(executable, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    _run_subprocess_cached(
+        [str(executable), "collection", "list"], check=False, cache_dir=cache_dir
+    )
+    assert counter.read_text() == "x\nx\nx\n"
+
+    # Results and locks are stored per cache key
+    assert len(list((cache_dir / "command-cache").glob("*.lock"))) == 3
+    assert len(list((cache_dir / "command-cache").glob("*.json"))) == 3
+
+    # Adding or modifying ansible.cfg invalidates the cache
+    ansible_cfg = tmp_path / "ansible.cfg"
+    ansible_cfg.write_text("[defaults]\n")
+    _run_subprocess_cached(
+        [str(executable), "collection", "list"], check=False, cache_dir=cache_dir
+    )
+    assert counter.read_text() == "x\nx\nx\nx\n"
+    ansible_cfg.write_text("[defaults]\ncollections_path = /\n")
+    _run_subprocess_cached(
+        [str(executable), "collection", "list"], check=False, cache_dir=cache_dir
+    )
+    assert counter.read_text() == "x\nx\nx\nx\nx\n"
+
+    # So does modifying the file ANSIBLE_CONFIG points to
+    other_cfg = tmp_path / "other.cfg"
+    other_cfg.write_text("[defaults]\n")
+    monkeypatch.setenv("ANSIBLE_CONFIG", str(other_cfg))
+    _run_subprocess_cached(
+        [str(executable), "collection", "list"], check=False, cache_dir=cache_dir
+    )
+    _run_subprocess_cached(
+        [str(executable), "collection", "list"], check=False, cache_dir=cache_dir
+    )
+    assert counter.read_text() == "x\nx\nx\nx\nx\nx\n"
+    stat = other_cfg.stat()
+    os.utime(other_cfg, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    _run_subprocess_cached(
+        [str(executable), "collection", "list"], check=False, cache_dir=cache_dir
+    )
+    assert counter.read_text() == "x\nx\nx\nx\nx\nx\nx\n"
+
+
+@pytest.mark.parametrize("json_format", [False, True])
+def test__run_subprocess_cached_roots(
+    json_format: bool, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    counter = tmp_path / "counter"
+    root = tmp_path / "ansible_collections"
+    root.mkdir()
+    output = f'{{"{root}": {{}}}}' if json_format else f"# {root}"
+    executable = tmp_path / "ansible-galaxy"
+    executable.write_text(f"#!/bin/sh\necho x >> {counter}\necho '{output}'\n")
+    executable.chmod(0o755)
+    args = [str(executable), "collection", "list"]
+    cache_dir = tmp_path / "cache"
+
+    _run_subprocess_cached(args, check=False, cache_dir=cache_dir)
+    _run_subprocess_cached(args, check=False, cache_dir=cache_dir)
+    assert counter.read_text() == "x\n"
+
+    # Adding a namespace invalidates the cache
+    (root / "foo").mkdir()
+    _run_subprocess_cached(args, check=False, cache_dir=cache_dir)
+    _run_subprocess_cached(args, check=False, cache_dir=cache_dir)
+    assert counter.read_text() == "x\nx\n"
+
+    # Adding a collection to an existing namespace invalidates the cache
+    (root / "foo" / "bar").mkdir()
+    os.utime(root / "foo", ns=(0, 0))
+    _run_subprocess_cached(args, check=False, cache_dir=cache_dir)
+    assert counter.read_text() == "x\nx\nx\n"
+
+
+def test__run_subprocess_cached_prune(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    executable = tmp_path / "ansible-galaxy"
+    executable.write_text("#!/bin/sh\necho output\n")
+    executable.chmod(0o755)
+    cache_dir = tmp_path / "cache"
+    directory = cache_dir / "command-cache"
+    directory.mkdir(parents=True)
+    old_files = [directory / "old.json", directory / "old.lock"]
+    new_files = [directory / "new.json", directory / "new.lock"]
+    for file in old_files + new_files:
+        file.write_text("")
+    for file in old_files:
+        os.utime(file, ns=(0, 0))
+
+    _run_subprocess_cached(
+        [str(executable), "collection", "list"], check=False, cache_dir=cache_dir
+    )
+
+    # Expired files of other keys are removed
+    assert not any(file.exists() for file in old_files)
+    assert all(file.exists() for file in new_files)
+    assert len(list(directory.glob("*.json"))) == 2
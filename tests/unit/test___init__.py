@@ -0,0 +1,21 @@
+# Author: Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or
+# https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026, Ansible Project
+
+from __future__ import annotations
+
+import pytest
+
+import antsibull_nox
+
+
+def test_lazy_attributes() -> None:
+    assert antsibull_nox.sessions.__name__ == "antsibull_nox.sessions"
+    assert antsibull_nox.IN_CI in (True, False)
+
+    # Unknown attributes are not imported as submodules
+    assert not hasattr(antsibull_nox, "foo")
+    with pytest.raises(AttributeError, match="has no attribute 'foo'"):
+        antsibull_nox.foo  # pylint: disable=pointless-statement
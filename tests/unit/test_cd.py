@@ -0,0 +1,109 @@
+# Author: Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or
+# https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026, Ansible Project
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+import antsibull_nox.cd
+from antsibull_nox.cd import get_base_branch, get_changes, init_cd, supports_cd
+from antsibull_nox.config import load_config_from_toml
+
+GET_CHANGES_DATA: list[tuple[str, str, list[str], list[str]]] = [
+    (
+        "/repo",
+        "/repo",
+        ["a", "b/c"],
+        ["a", "b/c"],
+    ),
+    (
+        "/repo",
+        "/repo/b",
+        ["a", "b/c", "b/d/e", "bb"],
+        ["../a", "c", "d/e", "../bb"],
+    ),
+    (
+        "/repo/sub",
+        "/repo",
+        ["a", "b/c"],
+        ["sub/a", "sub/b/c"],
+    ),
+    (
+        "/repo",
+        "/other",
+        ["a"],
+        ["../repo/a"],
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "repo, relative_to, changes, expected",
+    GET_CHANGES_DATA,
+)
+def test_get_changes(
+    repo: str,
+    relative_to: str,
+    changes: list[str],
+    expected: list[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class FakeCDConfig:
+        def __init__(self) -> None:
+            self.repo = Path(repo)
+
+    monkeypatch.setattr(antsibull_nox.cd, "_cd_initialized", True)
+    monkeypatch.setattr(antsibull_nox.cd, "_cd_config", FakeCDConfig())
+    monkeypatch.setattr(
+        antsibull_nox.cd,
+        "_get_repo_changes",
+        lambda: tuple(Path(change) for change in changes),
+    )
+    assert get_changes(relative_to=Path(relative_to)) == [
+        Path(path) for path in expected
+    ]
+
+
+def test_get_changes_no_cd(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(antsibull_nox.cd, "_cd_initialized", True)
+    monkeypatch.setattr(antsibull_nox.cd, "_cd_config", None)
+    antsibull_nox.cd._get_repo_changes.cache_clear()
+    assert get_changes() is None
+
+
+def test_not_initialized(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(antsibull_nox.cd, "_cd_initialized", False)
+    monkeypatch.setattr(antsibull_nox.cd, "_cd_config", None)
+    with pytest.raises(
+        RuntimeError, match="^Internal error: init_cd\\(\\) has not been called!$"
+    ):
+        supports_cd()
+    with pytest.raises(RuntimeError):
+        get_base_branch()
+
+
+def test_init_cd_environment(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    config_path = tmp_path / "antsibull-nox.toml"
+    config_path.write_text('[vcs]\nvcs = "git"\ndevelopment_branch = "main"\n')
+    config = load_config_from_toml(config_path)
+    monkeypatch.setattr(antsibull_nox.cd, "_cd_initialized", False)
+    monkeypatch.setattr(antsibull_nox.cd, "_cd_config", None)
+    monkeypatch.delenv("ANTSIBULL_CHANGE_DETECTION", raising=False)
+    monkeypatch.delenv("ANTSIBULL_BASE_BRANCH", raising=False)
+
+    init_cd(config=config, config_path=config_path)
+    assert not supports_cd()
+
+    # The environment is evaluated by every init_cd() call
+    monkeypatch.setenv("ANTSIBULL_CHANGE_DETECTION", "true")
+    monkeypatch.setenv("ANTSIBULL_BASE_BRANCH", "stable")
+    init_cd(config=config, config_path=config_path, ignore_previous_calls=True)
+    assert supports_cd()
+    assert get_base_branch() == "stable"
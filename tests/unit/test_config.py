@@ -0,0 +1,31 @@
+# Author: Felix Fontein <felix@fontein.de>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or
+# https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+# SPDX-FileCopyrightText: 2026, Ansible Project
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from antsibull_nox.config import load_config_from_toml
+
+
+def test_load_config_from_toml(tmp_path: Path) -> None:
+    path = tmp_path / "antsibull-nox.toml"
+    path.write_text('[vcs]\nvcs = "git"\ndevelopment_branch = "main"\n')
+    config = load_config_from_toml(path)
+    assert config.vcs is not None
+    assert config.vcs.development_branch == "main"
+
+    # Loading the unchanged file again returns the same object
+    assert load_config_from_toml(path) is config
+
+    # Modifying the file loads it again
+    path.write_text('[vcs]\nvcs = "git"\ndevelopment_branch = "stable"\n')
+    os.utime(path, ns=(0, 0))
+    config_2 = load_config_from_toml(path)
+    assert config_2 is not config
+    assert config_2.vcs is not None
+    assert config_2.vcs.development_branch == "stable"
@@ -8,11 +8,15 @@ from __future__ import annotations
 
 import re
 import typing as t
+from pathlib import Path
 
 import pytest
+from antsibull_fileutils.yaml import load_yaml_file
 
+from antsibull_nox.collection import CollectionData
 from antsibull_nox.ee_config import (
     create_ee_config,
+    generate_ee_config,
     set_value,
 )
 
@@ -98,6 +102,60 @@ def test_set_value_fail(
         set_value(destination, path, value)
 
 
+def test_generate_ee_config(tmp_path: Path) -> None:
+    ee_config = {
+        "version": 3,
+        "dependencies": {
+            "ansible_core": {"package_pip": "ansible-core"},
+        },
+        "additional_build_files": [
+            {"src": "foo", "dest": "bar"},
+        ],
+    }
+    tarball = tmp_path / "foo-bar-1.0.0.tar.gz"
+    generate_ee_config(
+        directory=tmp_path,
+        collection_tarball_path=tarball,
+        collection_data=CollectionData(
+            collections_root_path=None,
+            path=tmp_path,
+            namespace="foo",
+            name="bar",
+            full_name="foo.bar",
+            version="1.0.0",
+            dependencies={},
+            current=True,
+        ),
+        ee_config=ee_config,
+    )
+    assert load_yaml_file(tmp_path / "requirements.yml") == {
+        "collections": [
+            {"name": "src/foo-bar-1.0.0.tar.gz", "type": "file"},
+        ],
+    }
+    assert load_yaml_file(tmp_path / "execution-environment.yml") == {
+        "version": 3,
+        "dependencies": {
+            "ansible_core": {"package_pip": "ansible-core"},
+            "galaxy": "requirements.yml",
+        },
+        "additional_build_files": [
+            {"src": "foo", "dest": "bar"},
+            {"src": str(tarball), "dest": "src"},
+        ],
+    }
+    # The passed config must not be modified
+    assert ee_config == {
+        "version": 3,
+        "dependencies": {
+            "ansible_core": {"package_pip": "ansible-core"},
+        },
+        "additional_build_files": [
+            {"src": "foo", "dest": "bar"},
+        ],
+    }
+
+
 CREATE_EE_CONFIG_DATA: list[
     tuple[
         int,
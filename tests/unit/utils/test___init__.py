@@ -6,6 +6,8 @@
 
 from __future__ import annotations
 
+from dataclasses import asdict, astuple
+
 import pytest
 
 from antsibull_nox.utils import Version, version_range
@@ -30,6 +32,10 @@ def test_version_parse(version_string: str, expected_version: Version) -> None:
     assert Version.parse(version_string) == expected_version
 
 
+def test_version_parse_cached() -> None:
+    assert Version.parse("3.10") is Version.parse("3.10")
+
+
 def test_verison_parse_fail() -> None:
     with pytest.raises(ValueError, match=r"^Cannot parse '1' as version string\.$"):
         Version.parse("1")
@@ -38,6 +44,27 @@ def test_verison_parse_fail() -> None:
         Version.parse("1.a")
 
 
+def test_version_hash_str() -> None:
+    assert hash(Version(2, 3)) == hash(Version.parse("2.3"))
+    assert str(Version(2, 3)) == "2.3"
+    assert repr(Version(2, 3)) == "Version(major=2, minor=3)"
+
+
+def test_version_compare() -> None:
+    assert Version(2, 3) == Version(2, 3)
+    assert Version(2, 3) != Version(2, 4)
+    assert Version(2, 3) != "2.3"
+    assert Version(2, 9) < Version(2, 10)
+    assert Version(2, 10) <= Version(2, 10)
+    assert Version(3, 0) > Version(2, 10)
+    assert Version(3, 0) >= Version(2, 10)
+    assert sorted([Version(3, 1), Version(2, 9), Version(2, 10)]) == [
+        Version(2, 9),
+        Version(2, 10),
+        Version(3, 1),
+    ]
+
+
 def test_version_next() -> None:
     assert Version(2, 3).next_minor_version() == Version(2, 4)
     assert Version(1, 9).next_minor_version() == Version(1, 10)
@@ -90,3 +117,13 @@ def test_version_range_fail() -> None:
         ),
     ):
         next(version_range(Version(1, 2), Version(2, 3), inclusive=True))
+
+
+def test_version_dataclass() -> None:
+    version = Version(2, 3)
+    # Use the cached values before checking that they do not leak
+    assert hash(version) == hash(Version(2, 3))
+    assert str(version) == "2.3"
+    assert asdict(version) == {"major": 2, "minor": 3}
+    assert astuple(version) == (2, 3)
+    assert repr(version) == "Version(major=2, minor=3)"